@@ -12,10 +12,14 @@
 
 import sys
 import argparse
+import collections
+import http.client
+import threading
 import telestai
 import telestai.core
-from telestai.rpc import TelestaiProxy
-from telestai.core import COIN
+from telestai.rpc import TelestaiProxy, JSONRPCError
+from concurrent.futures import ThreadPoolExecutor
+from telestai.core import COIN, CBlock
 from telestai.core.assets import RvnAssetData
 from telestai.core.script import OP_TLS_ASSET, CScriptOp
 from telestai.assets import CAssetName
@@ -28,6 +32,16 @@ parser.add_argument('--startblock', type=int, default=0,
                     help="Scan starting block")
 parser.add_argument('--match', type=str, default="",
                     help="Asset name match string (default: all)")
+parser.add_argument('--batchsize', type=int, default=200,
+                    help="Number of blocks fetched per JSON-RPC batch (default: 200)")
+parser.add_argument('--prefetch', type=int, default=16,
+                    help="Number of batches fetched ahead of the scan (default: 16)")
+parser.add_argument('--blockcache', type=int, default=1024,
+                    help="Number of recently decoded blocks kept in memory (default: 1024)")
+parser.add_argument('--rest', action="store_true",
+                    help="Fetch blocks from the REST interface (telestaid -rest) instead of getblock")
+parser.add_argument('--restport', type=int, default=0,
+                    help="REST port (default: the network's RPC port)")
 args = parser.parse_args()
 
 start = args.startblock
@@ -46,11 +60,126 @@ except Exception as e:
     print("Error: ".format(e))
     sys.exit(1)
 
-for c in range(start, end):
-    blockhash = r.getblockhash(c)
-    block = r.getblock(blockhash)
+
+local = threading.local()
+
+
+def get_proxy():
+    """Return this thread's proxy; proxies hold one connection and can't be shared"""
+    try:
+        return local.proxy
+    except AttributeError:
+        local.proxy = TelestaiProxy()
+        return local.proxy
+
+
+def get_rest_conn():
+    """Return this thread's persistent connection to the REST interface"""
+    try:
+        return local.rest_conn
+    except AttributeError:
+        port = args.restport or telestai.params.RPC_PORT
+        local.rest_conn = http.client.HTTPConnection('localhost', port, timeout=30)
+        return local.rest_conn
+
+
+def rest_block(blockhash):
+    """Fetch a serialized block from /rest/block/<hash>.bin, bypassing JSON"""
+    conn = get_rest_conn()
+    conn.request('GET', '/rest/block/%s.bin' % blockhash)
+    response = conn.getresponse()
+    data = response.read()
+    if response.status != 200:
+        raise IOError('REST request for block %s failed: %d %s' %
+                      (blockhash, response.status, response.reason))
+    return data
+
+
+def batch_call(method, params_list):
+    """Issue one JSON-RPC batch of method calls, returning results in order"""
+    rpc_call_list = [{'version': '1.1', 'method': method, 'params': params, 'id': i}
+                     for i, params in enumerate(params_list)]
+    response = get_proxy()._batch(rpc_call_list)
+    results = [None] * len(rpc_call_list)
+    for resp in response:
+        if resp.get('error') is not None:
+            raise JSONRPCError(resp['error'])
+        results[resp['id']] = resp['result']
+    return results
+
+
+block_cache = collections.OrderedDict()
+block_cache_lock = threading.Lock()
+
+
+def fetch_blocks_by_hash(hashes):
+    """Fetch and deserialize the blocks with the given hex hashes"""
+    if args.rest:
+        return [CBlock.deserialize(rest_block(h)) for h in hashes]
+    raw_blocks = batch_call('getblock', [[h, 0] for h in hashes])
+    return [CBlock.deserialize(bytes.fromhex(raw)) for raw in raw_blocks]
+
+
+def cached_blocks(hashes):
+    """Return the blocks for hashes, only fetching those not already cached
+
+    Keeps the last --blockcache decoded blocks by hash, so heights that are
+    looked up again (overlapping ranges, a rescan of the tip) are neither
+    fetched nor deserialized twice.
+    """
+    blocks = {}
+    with block_cache_lock:
+        for h in hashes:
+            if h in block_cache:
+                block_cache.move_to_end(h)
+                blocks[h] = block_cache[h]
+    missing = list(dict.fromkeys(h for h in hashes if h not in blocks))
+    if missing:
+        blocks.update(zip(missing, fetch_blocks_by_hash(missing)))
+        with block_cache_lock:
+            for h in missing:
+                block_cache[h] = blocks[h]
+            while len(block_cache) > args.blockcache:
+                block_cache.popitem(last=False)
+    return [blocks[h] for h in hashes]
+
+
+def fetch_blocks(heights):
+    """Fetch the blocks at heights with two round-trips: hashes, then blocks
+
+    Blocks are requested as raw hex (verbosity 0) and deserialized locally,
+    so the daemon never builds the decoded JSON form of each transaction.
+    The hashes are passed back to getblock as the hex strings they came in.
+    With --rest the blocks come from the REST interface as binary instead,
+    one request per block over this thread's keep-alive connection.
+    """
+    return cached_blocks(batch_call('getblockhash', [[h] for h in heights]))
+
+
+def scan_blocks(start, end, batchsize, prefetch):
+    """Yield blocks in height order while up to prefetch batches are in flight"""
+    windows = (range(batch_start, min(batch_start + batchsize, end))
+               for batch_start in range(start, end, batchsize))
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = collections.deque()
+        for heights in windows:
+            pending.append(executor.submit(fetch_blocks, heights))
+            if len(pending) >= prefetch:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# Most outputs carry no asset data; a byte search rules them out without
+# running the script iterator. Pushed data can contain 0xc0 too, so a hit
+# still goes through the full parse below.
+OP_TLS_ASSET_BYTE = bytes([OP_TLS_ASSET])
+
+for block in scan_blocks(start, end, args.batchsize, args.prefetch):
     for tx in block.vtx:
         for v in tx.vout:
+            if OP_TLS_ASSET_BYTE not in v.scriptPubKey:
+                continue
             try:
                 get_data = False
                 data = []
@@ -65,6 +65,9 @@ for x in ignore_re_str:
     ignore_regex.append(re.compile(x))
 
 
+# Skip the script iterator for outputs that can't contain OP_RETURN
+OP_RETURN_BYTE = bytes([OP_RETURN])
+
 blockchain = Blockchain(blockchain_path)
 c = args.startblock
 for block in blockchain.get_ordered_blocks(index_path, start=args.startblock, end=endblock, cache=args.cachefile):
@@ -77,6 +80,8 @@ for block in blockchain.get_ordered_blocks(index_path, start=args.startblock, en
             pass
         for vout in tx.vout:
             spk = vout.scriptPubKey
+            if OP_RETURN_BYTE not in spk:
+                continue
             if spk.is_witness_scriptpubkey():
                 continue
             if spk[2:6] == b'\xaa\x21\xa9\xed':  # segwit
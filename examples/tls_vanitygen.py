@@ -15,12 +15,17 @@
 # Note this is not particularly secure as the private keys may remain accessible in (virtual) memory
 
 import argparse
+import multiprocessing
 import re
 import os
 import sys
+import threading
 import time
+from hashlib import sha256
 
 import telestai.base58
+from telestai.core.key import CECKey
+from telestai.core.serialize import Hash160
 from telestai.wallet import P2PKHTelestaiAddress, CTelestaiSecret
 
 parser = argparse.ArgumentParser(
@@ -33,6 +38,8 @@ parser.add_argument('--endswith', action="store_true",
                     help="Search for string anywhere in address (default: leading characters only)")
 parser.add_argument('--ignorecase', action="store_true",
                     help="Search for string anywhere in address (default: leading characters only)")
+parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                    help="Number of worker processes (default: number of CPUs)")
 args = parser.parse_args()
 
 search_s = args.search
@@ -57,48 +64,176 @@ except telestai.base58.InvalidBase58Error as e:
 
 telestai.SelectParams('mainnet')
 
-c = 0
-start = time.time()
+# secp256k1 field prime and group order
+P = 2**256 - 2**32 - 977
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# Keys tried per random seed before drawing a fresh one
+KEYS_PER_SEED = 2**16
+# Keys derived per batched modular inversion; divides KEYS_PER_SEED
+BATCH_SIZE = 256
+
+# The address is built straight from the pubkey hash; wallet objects are
+# only constructed for the match.
+eckey = CECKey()
+eckey.set_compressed(False)
+version = bytes([telestai.params.BASE58_PREFIXES['PUBKEY_ADDR']])
+version_sha256 = sha256(version)
+
+
+def point(secret):
+    """Return the affine point secret*G using the OpenSSL key code"""
+    eckey.set_secretbytes(secret.to_bytes(32, 'big'))
+    pubkey = eckey.get_pubkey()
+    return int.from_bytes(pubkey[1:33], 'big'), int.from_bytes(pubkey[33:65], 'big')
+
+
+# G, 2G, ..., BATCH_SIZE*G
+multiples = [point(i) for i in range(1, BATCH_SIZE + 1)]
+
+
+def batch_inverse(values):
+    """Invert every value mod P with a single modular inversion
 
-if endswith:
-    pattern = search_s + r'$'
+    Montgomery's trick: invert the product of all values, then peel the
+    individual inverses off it with two multiplications each.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        acc = acc * v % P
+        prefix.append(acc)
+    inv = pow(acc, P - 2, P)
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = inv * prefix[i - 1] % P
+        inv = inv * values[i] % P
+    result[0] = inv
+    return result
+
+
+def candidate_batches():
+    """Yield lists of (secret exponent, compressed pubkey) pairs
+
+    Only one EC multiplication is done per KEYS_PER_SEED keys: after Q = dG
+    the following keys are d+1, d+2, ... For each batch the pubkeys
+    Q+G, Q+2G, ..., Q+BATCH_SIZE*G are affine additions of the precomputed
+    multiples, whose modular inverses are all found with one batch_inverse.
+    The last point of a batch is the Q of the next.
+    """
     while True:
-        entropy = os.urandom(32)
-        privkey = CTelestaiSecret.from_secret_bytes(entropy)
-        addr = str(P2PKHTelestaiAddress.from_pubkey(privkey.pub))
-        if re.search(pattern, addr, case):
-            break
-        c += 1
-        if c % 10000 == 0:
-            sec = time.time()-start
-            sys.stdout.write(f'Try {c} ({round(c/sec)} keys/s) ({(time.time()-start) / 60 / 60} hours)      \r')
-            sys.stdout.flush()
+        d = int.from_bytes(os.urandom(32), 'big') % (N - KEYS_PER_SEED - 1) + 1
+        x, y = point(d)
+        batch = [(d, bytes((2 + (y & 1),)) + x.to_bytes(32, 'big'))]
+        for base in range(d, d + KEYS_PER_SEED, BATCH_SIZE):
+            invs = batch_inverse([mx - x for mx, my in multiples])
+            for i, (mx, my), inv in zip(range(base + 1, base + BATCH_SIZE + 1), multiples, invs):
+                lam = (my - y) * inv % P
+                x3 = (lam * lam - x - mx) % P
+                y3 = (lam * (x - x3) - y) % P
+                batch.append((i, bytes((2 + (y3 & 1),)) + x3.to_bytes(32, 'big')))
+            yield batch
+            batch = []
+            x, y = x3, y3
+
+
+def address_from_payload(payload):
+    """Base58check-encode version + hash160
+
+    The version byte is the same for every candidate, so the checksum's
+    first SHA256 resumes from version_sha256 instead of rehashing it.
+    """
+    h = version_sha256.copy()
+    h.update(payload[1:])
+    return telestai.base58.encode(payload + sha256(h.digest()).digest()[:4])
+
+
+def prefix_to_int_range(prefix):
+    """Return the range of version+hash160 payloads whose addresses may start with prefix
+
+    Base58 is positional, so every address starting with prefix encodes an
+    integer between prefix+'111...' and prefix+'zzz...'. The checksum only
+    occupies the low 32 bits, so dropping them gives a (slightly wider) range
+    that can be tested before any checksum or base58 work is done.
+    """
+    lengths = [len(address_from_payload(version + fill * 20))
+               for fill in (b'\x00', b'\xff')]
+    lo = telestai.base58.decode(prefix + '1' * (min(lengths) - len(prefix)))
+    hi = telestai.base58.decode(prefix + 'z' * (max(lengths) - len(prefix)))
+    return int.from_bytes(lo, 'big') >> 32, int.from_bytes(hi, 'big') >> 32
+
+
+# Plain string methods unless the search is case-insensitive
+if ignorecase:
+    if endswith:
+        pattern = search_s + r'$'
+    elif anywhere:
+        pattern = search_s
+    else:  # startswith
+        pattern = r'^' + search_s
+    matcher = re.compile(pattern, case).search
+elif endswith:
+    def matcher(addr): return addr.endswith(search_s)
 elif anywhere:
-    pattern = search_s
-    while True:
-        entropy = os.urandom(32)
-        privkey = CTelestaiSecret.from_secret_bytes(entropy)
-        addr = str(P2PKHTelestaiAddress.from_pubkey(privkey.pub))
-        if re.search(pattern, addr, case):
-            break
-        c += 1
-        if c % 10000 == 0:
-            sec = time.time()-start
-            sys.stdout.write(f'Try {c} ({round(c/sec)} keys/s) ({(time.time()-start) / 60 / 60} hours)      \r')
-            sys.stdout.flush()
-else:# startswith
-    pattern = r'^' + search_s
+    def matcher(addr): return search_s in addr
+else:  # startswith
+    def matcher(addr): return addr.startswith(search_s)
+
+if anywhere or endswith or ignorecase:
+    lo, hi = 0, 1 << 168
+else:
+    lo, hi = prefix_to_int_range(search_s)
+
+
+def search(found, tries):
+    """Worker: scan candidates until one matches, then report it on found
+
+    The shared tries counter is bumped once per batch, keeping the
+    per-key loop free of bookkeeping.
+    """
+    for batch in candidate_batches():
+        for d, pubkey in batch:
+            payload = version + Hash160(pubkey)
+            if lo <= int.from_bytes(payload, 'big') <= hi:
+                addr = address_from_payload(payload)
+                if matcher(addr):
+                    found.put((d, addr))
+                    return
+        with tries.get_lock():
+            tries.value += len(batch)
+
+
+def print_status():
+    """Report the workers' progress once a second"""
     while True:
-        entropy = os.urandom(32)
-        privkey = CTelestaiSecret.from_secret_bytes(entropy)
-        addr = str(P2PKHTelestaiAddress.from_pubkey(privkey.pub))
-        if re.search(pattern, addr, case):
-            break
-        c += 1
-        if c % 10000 == 0:
-            sec = time.time()-start
-            sys.stdout.write(f'Try {c} ({round(c/sec)} keys/s) ({(time.time()-start) / 60 / 60} hours)      \r')
-            sys.stdout.flush()
+        time.sleep(1)
+        c = tries.value
+        sec = time.time()-start
+        sys.stdout.write(f'Try {c} ({round(c/sec)} keys/s) ({sec / 60 / 60} hours)      \r')
+        sys.stdout.flush()
+
+
+# Workers are forked so they inherit the search settings above; each one
+# draws its own random seeds.
+ctx = multiprocessing.get_context('fork')
+found = ctx.Queue()
+tries = ctx.Value('Q', 0)
+workers = [ctx.Process(target=search, args=(found, tries), daemon=True)
+           for _ in range(args.workers)]
+
+start = time.time()
+for w in workers:
+    w.start()
+
+threading.Thread(target=print_status, daemon=True).start()
+d, addr = found.get()
+
+for w in workers:
+    w.terminate()
+
+entropy = d.to_bytes(32, 'big')
+privkey = CTelestaiSecret.from_secret_bytes(entropy)
+assert str(P2PKHTelestaiAddress.from_pubkey(privkey.pub)) == addr
 
 print()
 print((time.time()-start) / 60 / 60, 'hours')
@@ -52,13 +52,32 @@ class RegTestParams(telestai.core.CoreRegTestParams):
     BECH32_HRP = ''
 
 
+# Chain params are immutable class attributes, so one instance per chain is
+# shared by every SelectParams() call.
+_CHAIN_PARAMS = {'mainnet': MainParams(),
+                 'testnet': TestNetParams(),
+                 'regtest': RegTestParams()}
+
+
 """Master global setting for what chain params we're using.
 
 However, don't set this directly, use SelectParams() instead so as to set the
 telestai.core.params correctly too.
 """
 # params = telestai.core.coreparams = MainParams()
-params = MainParams()
+params = _CHAIN_PARAMS['mainnet']
+
+# Called with the new params by SelectParams(); see _add_params_hook()
+_params_hooks = []
+
+
+def _add_params_hook(hook):
+    """Call hook(params) now and again whenever SelectParams() is called
+
+    Lets modules cache values derived from the chain params.
+    """
+    _params_hooks.append(hook)
+    hook(params)
 
 
 def SelectParams(name):
@@ -70,11 +89,9 @@ def SelectParams(name):
     """
     global params
     telestai.core._SelectCoreParams(name)
-    if name == 'mainnet':
-        params = telestai.core.coreparams = MainParams()
-    elif name == 'testnet':
-        params = telestai.core.coreparams = TestNetParams()
-    elif name == 'regtest':
-        params = telestai.core.coreparams = RegTestParams()
-    else:
+    try:
+        params = telestai.core.coreparams = _CHAIN_PARAMS[name]
+    except KeyError:
         raise ValueError('Unknown chain %r' % name)
+    for hook in _params_hooks:
+        hook(params)
@@ -14,7 +14,6 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 import telestai.core
-import binascii
 
 import sys
 _bchr = chr
@@ -26,6 +25,7 @@ if sys.version > '3':
 
 
 B58_DIGITS = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+_B58_DIGIT_VALUES = {c: i for i, c in enumerate(B58_DIGITS)}
 
 
 class Base58Error(Exception):
@@ -44,7 +44,7 @@ def encode(b):
     """Encode bytes to a base58-encoded string"""
 
     # Convert big-endian bytes to integer
-    n = int('0x0' + binascii.hexlify(b).decode('utf8'), 16)
+    n = int.from_bytes(b, 'big')
 
     # Divide that integer into bas58
     res = []
@@ -54,16 +54,7 @@ def encode(b):
     res = ''.join(res[::-1])
 
     # Encode leading zeros as base58 zeros
-    czero = b'\x00'
-    if sys.version > '3':
-        # In Python3 indexing a bytes returns numbers, not characters.
-        czero = 0
-    pad = 0
-    for c in b:
-        if c == czero:
-            pad += 1
-        else:
-            break
+    pad = len(b) - len(b.lstrip(b'\x00'))
     return B58_DIGITS[0] * pad + res
 
 
@@ -75,18 +66,15 @@ def decode(s):
     # Convert the string to an integer
     n = 0
     for c in s:
-        n *= 58
-        if c not in B58_DIGITS:
+        try:
+            digit = _B58_DIGIT_VALUES[c]
+        except KeyError:
             raise InvalidBase58Error(
                 'Character %r is not a valid base58 character' % c)
-        digit = B58_DIGITS.index(c)
-        n += digit
+        n = n * 58 + digit
 
     # Convert the integer to bytes
-    h = '%x' % n
-    if len(h) % 2:
-        h = '0' + h
-    res = binascii.unhexlify(h.encode('utf8'))
+    res = n.to_bytes((n.bit_length() + 7) // 8 or 1, 'big')
 
     # Add padding back.
     pad = 0
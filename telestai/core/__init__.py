@@ -50,7 +50,7 @@ def _py2_x(h):
 
 def x(h):
     """Convert a hex string to bytes"""
-    return binascii.unhexlify(h.encode('utf8'))
+    return bytes.fromhex(h)
 
 
 def _py2_b2x(b):
@@ -60,7 +60,7 @@ def _py2_b2x(b):
 
 def b2x(b):
     """Convert bytes to a hex string"""
-    return binascii.hexlify(b).decode('utf8')
+    return b.hex()
 
 
 def _py2_lx(h):
@@ -78,7 +78,7 @@ def lx(h):
     Lets you write uint256's and uint160's the way the Satoshi codebase shows
     them.
     """
-    return binascii.unhexlify(h.encode('utf8'))[::-1]
+    return bytes.fromhex(h)[::-1]
 
 
 def _py2_b2lx(b):
@@ -96,7 +96,7 @@ def b2lx(b):
     Lets you show uint256's and uint160's the way the Satoshi codebase shows
     them.
     """
-    return binascii.hexlify(b[::-1]).decode('utf8')
+    return b[::-1].hex()
 
 
 if not (sys.version > '3'):
@@ -836,8 +836,12 @@ class CoreRegTestParams(CoreTestNetParams):
     nX16RV2ActivationTime = 1566571889
 
 
+_CORE_CHAIN_PARAMS = {'mainnet': CoreMainParams(),
+                      'testnet': CoreTestNetParams(),
+                      'regtest': CoreRegTestParams()}
+
 """Master global setting for what core chain params we're using"""
-coreparams = CoreMainParams()
+coreparams = _CORE_CHAIN_PARAMS['mainnet']
 
 
 def _SelectCoreParams(name):
@@ -847,13 +851,9 @@ def _SelectCoreParams(name):
     consensus-critical and general parameters are set properly.
     """
     global coreparams
-    if name == 'mainnet':
-        coreparams = CoreMainParams()
-    elif name == 'testnet':
-        coreparams = CoreTestNetParams()
-    elif name == 'regtest':
-        coreparams = CoreRegTestParams()
-    else:
+    try:
+        coreparams = _CORE_CHAIN_PARAMS[name]
+    except KeyError:
         raise ValueError('Unknown chain %r' % name)
 
 
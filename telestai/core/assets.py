@@ -35,6 +35,15 @@ null_types = {
 }
 
 
+# op_tls_asset payload header (prefix, asset type, name length), and the
+# amount following the name
+_ASSET_HEADER = struct.Struct('< 3s B B')
+_ASSET_AMOUNT = struct.Struct('< q')
+
+# Asset types followed by an asset name
+_NAMED_ASSET_TYPES = frozenset((0x74, 0x71, 0x6f, 0x72))
+
+
 def isnullassettype(data):
 
     result = False
@@ -130,6 +139,41 @@ class RvnAssetData(object):
                     else:
                         self._ipfshash = self._ipfshash.hex()
 
+    @classmethod
+    def parse_many(cls, buffers):
+        """Parse the type, name and amount of many op_tls_asset payloads
+
+        For bulk work such as scanning a mempool: no object is built per
+        payload. Returns three parallel lists (asset_types, asset_names,
+        amounts), each entry equal to the asset_type, asset_name and amount
+        of RvnAssetData(buf). Raises ValueError for an unknown asset type.
+        """
+        _unpack_header = _ASSET_HEADER.unpack_from
+        _unpack_amount = _ASSET_AMOUNT.unpack_from
+        _x = x
+        types = []
+        names = []
+        amounts = []
+        for data in buffers:
+            if type(data) is str:
+                data = _x(data)
+            name = ""
+            amount = 0
+            if data[:3] != b'tls':
+                asset_type = 0
+            else:
+                asset_type, name_length = _unpack_header(data)[1:]
+                if asset_type not in asset_types:
+                    raise ValueError("Unknown asset type {}".format(asset_type))
+                if asset_type in _NAMED_ASSET_TYPES:
+                    name = data[5:5 + name_length].decode('ascii')
+                    if asset_type != 0x6f:  # admin asset has no amount
+                        amount = _unpack_amount(data, 5 + name_length)[0]
+            types.append(asset_types[asset_type])
+            names.append(name)
+            amounts.append(amount)
+        return types, names, amounts
+
     @property
     def asset_type(self):
         return asset_types.get(self._asset_type, 'unknown')
@@ -517,6 +517,11 @@ class CScriptTruncatedPushDataError(CScriptInvalidError):
         super(CScriptTruncatedPushDataError, self).__init__(msg)
 
 
+# Fixed bytes of a p2sh scriptPubKey: OP_HASH160 <20 bytes> OP_EQUAL
+_P2SH_HEAD = bytes([OP_HASH160, 0x14])
+_P2SH_TAIL = bytes([OP_EQUAL])
+
+
 class CScript(bytes):
     """Serialized script
 
@@ -689,9 +694,8 @@ class CScript(bytes):
         Note that this test is consensus-critical.
         """
         return (len(self) == 23 and
-                _bord(self[0]) == OP_HASH160 and
-                _bord(self[1]) == 0x14 and
-                _bord(self[22]) == OP_EQUAL)
+                self.startswith(_P2SH_HEAD) and
+                self.endswith(_P2SH_TAIL))
 
     def is_witness_scriptpubkey(self):
         """Returns true if this is a scriptpubkey signaling segregated witness data.
@@ -718,19 +722,19 @@ class CScript(bytes):
 
     def is_witness_v0_keyhash(self):
         """Returns true if this is a scriptpubkey for V0 P2WPKH. """
-        return len(self) == 22 and self[0:2] == b'\x00\x14'
+        return len(self) == 22 and self.startswith(b'\x00\x14')
 
     def is_witness_v0_nested_keyhash(self):
         """Returns true if this is a scriptSig for V0 P2WPKH embedded in P2SH. """
-        return len(self) == 23 and self[0:3] == b'\x16\x00\x14'
+        return len(self) == 23 and self.startswith(b'\x16\x00\x14')
 
     def is_witness_v0_scripthash(self):
         """Returns true if this is a scriptpubkey for V0 P2WSH. """
-        return len(self) == 34 and self[0:2] == b'\x00\x20'
+        return len(self) == 34 and self.startswith(b'\x00\x20')
 
     def is_witness_v0_nested_scripthash(self):
         """Returns true if this is a scriptSig for V0 P2WSH embedded in P2SH. """
-        return len(self) == 35 and self[0:3] == b'\x22\x00\x20'
+        return len(self) == 35 and self.startswith(b'\x22\x00\x20')
 
     def is_push_only(self):
         """Test if the script only contains pushdata ops
@@ -36,10 +36,14 @@ else:
 
 MAX_SIZE = 0x02000000
 
+# hashlib's OpenSSL-backed constructor; uses the CPU's SHA extensions where
+# OpenSSL detects them.
+_sha256 = hashlib.sha256
+
 
 def Hash(msg):
     """SHA256^2)(msg) -> bytes"""
-    return hashlib.sha256(hashlib.sha256(msg).digest()).digest()
+    return _sha256(_sha256(msg).digest()).digest()
 
 
 def X16RHash(msg):
@@ -66,9 +70,7 @@ def KawpowHash(msg):
 
 def Hash160(msg):
     """RIPEME160(SHA256(msg)) -> bytes"""
-    h = hashlib.new('ripemd160')
-    h.update(hashlib.sha256(msg).digest())
-    return h.digest()
+    return hashlib.new('ripemd160', _sha256(msg).digest()).digest()
 
 
 class SerializationError(Exception):
@@ -1,6 +1,8 @@
 from telestai.core import CMutableTransaction, CTransaction
 from telestai.core.script import OP_0, SIGHASH_ALL, SIGVERSION_BASE, CScript, SignatureHash
 
+SIGHASH_BYTE = bytes([SIGHASH_ALL])
+
 class CMultiSigTransaction(CMutableTransaction):
     """Transaction type for multisig operations with secure handling."""
     
@@ -30,12 +32,39 @@ class CMultiSigTransaction(CMutableTransaction):
         :return: Signature (bytes)
         """
         try:
-            signature = private_key.sign(sighash) + bytes([SIGHASH_ALL])
+            signature = private_key.sign(sighash) + SIGHASH_BYTE
             return signature
 
         except Exception as e:
             raise ValueError(f"Error signing transaction: {e}")
 
+    def sign_with_multiple_keys(self, private_keys, redeem_script, required,
+                                input_index=0, sigversion=SIGVERSION_BASE):
+        """
+        Sign one input with the first `required` private keys.
+
+        The sighash is computed once and shared by every key; keys past
+        `required` are not used.
+
+        :param private_keys: Private keys, in the order of the redeem script
+        :param redeem_script: CScript redeem script
+        :param required: Number of signatures the redeem script requires
+        :param input_index: Index of the input being signed
+        :param sigversion: Signature version
+        :return: List of signatures (bytes)
+        """
+        if len(private_keys) < required:
+            raise ValueError(
+                f"Need {required} private keys, got {len(private_keys)}")
+
+        sighash = self.generate_sighash(redeem_script, input_index, sigversion)
+        try:
+            return [private_key.sign(sighash) + SIGHASH_BYTE
+                    for private_key in private_keys[:required]]
+
+        except Exception as e:
+            raise ValueError(f"Error signing transaction: {e}")
+
     def apply_multisig_signatures(self, signatures_list, redeem_script):
         """
         Apply multiple collected signatures to a multisig transaction for P2SH.
@@ -47,9 +76,8 @@ class CMultiSigTransaction(CMutableTransaction):
             if not signatures_list or not redeem_script:
                 raise ValueError("Signatures and redeem script cannot be empty.")
 
-            for i,txin in enumerate(self.vin):
-                scriptSig = CScript([OP_0] + signatures_list[i] + [redeem_script])
-                txin.scriptSig = scriptSig
+            for i, txin in enumerate(self.vin):
+                txin.scriptSig = CScript([OP_0, *signatures_list[i], redeem_script])
 
             return self
 
@@ -22,6 +22,11 @@ a different implementation can be used instead, at your own risk:
 
 (``simplejson`` is the externally maintained version of the same module and
 thus better optimized but perhaps less stable.)
+
+If ``orjson`` is installed and ``json`` has not been patched, it
+is used to encode requests and to decode responses that contain no
+floating point numbers; those are always decoded with ``json`` so that they
+come back as ``Decimal``.
 """
 
 from __future__ import absolute_import, division, print_function, unicode_literals
@@ -30,22 +35,41 @@ try:
     import http.client as httplib
 except ImportError:
     import httplib
+import asyncio
 import base64
-import binascii
+import collections
+import contextlib
 import decimal
+import functools
 import json
 import os
 import platform
+import queue
 import re
-import sys
+import threading
+import time
 
 try:
     import urllib.parse as urlparse
 except ImportError:
     import urlparse
 
+from concurrent.futures import ThreadPoolExecutor
+
+# ujson is not used: it encodes Decimal as a float by itself, without calling
+# default, which rounds amounts.
+try:
+    import orjson as _fastjson
+except ImportError:
+    _fastjson = None
+
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
 import telestai
-from telestai.core import COIN, x, lx, b2lx, CBlock, CBlockHeader, CTransaction, COutPoint, CTxOut
+from telestai.core import COIN, x, lx, CBlock, CBlockHeader, CTransaction, COutPoint, CTxOut
 from telestai.core.script import CScript
 from telestai.wallet import CTelestaiAddress, CTelestaiSecret
 
@@ -53,14 +77,148 @@ DEFAULT_USER_AGENT = "AuthServiceProxy/0.1"
 
 DEFAULT_HTTP_TIMEOUT = 30
 
-# (un)hexlify to/from unicode, needed for Python3
-unhexlify = binascii.unhexlify
-hexlify = binascii.hexlify
-if sys.version > '3':
-    def unhexlify(h): return binascii.unhexlify(h.encode('utf8'))
-    def hexlify(b): return binascii.hexlify(b).decode('utf8')
+DEFAULT_CHAIN_CACHE_SIZE = 8192
+
+DEFAULT_LOOKUP_CACHE_SIZE = 4096
+
+DEFAULT_LOOKUP_CACHE_TTL = 30
+
+# Blocks at least this far below the tip are not expected to be reorganized
+# away, so their hashes can be cached by height
+CHAIN_CACHE_MIN_DEPTH = 100
+
+# The json module as imported, to tell whether it has been monkey patched
+_stdjson = json
+
+# A decimal point or signed exponent means the response may hold a float
+_MAY_HAVE_FLOAT_RE = re.compile(br'\.|[0-9][eE][-+]')
+
+# (un)hexlify to/from str; kept for code importing them from here
+unhexlify = bytes.fromhex
+def hexlify(b): return b.hex()
+
+
+# None of the JSON encoders can be handed a number's text directly, and going
+# through float would round amounts, so non-integral Decimals are encoded as
+# strings carrying a random per-process mark, which _json_dumps() then swaps
+# for the exact text.
+_DECIMAL_MARK = os.urandom(8).hex().encode()
+_DECIMAL_MARK_RE = re.compile(br'"\\u0000%b([-+.0-9E]+)\\u0000"' % _DECIMAL_MARK)
+
+
+def _json_default(obj):
+    """Encode the Decimal amounts that responses are parsed into"""
+    if isinstance(obj, decimal.Decimal):
+        if not obj.is_finite():
+            raise ValueError('%r can not be encoded as a JSON number' % obj)
+        if obj == obj.to_integral_value():
+            return int(obj)
+        return '\x00%s%s\x00' % (_DECIMAL_MARK.decode(), obj)
+    raise TypeError('%r is not JSON serializable' % obj)
+
+
+# Reused for every call: json.dumps() and json.loads() build a new encoder
+# or decoder each time they are given options
+_std_encoder = json.JSONEncoder(default=_json_default)
+_std_decoder = json.JSONDecoder(parse_float=decimal.Decimal)
+
+
+def _json_dumps(obj):
+    """Encode obj as JSON, returned as bytes ready to be POSTed"""
+    if json is not _stdjson:
+        data = json.dumps(obj, default=_json_default)
+    elif _fastjson is not None:
+        data = _fastjson.dumps(obj, default=_json_default)
+    else:
+        data = _std_encoder.encode(obj)
+    if isinstance(data, str):
+        data = data.encode('utf8')
+    if _DECIMAL_MARK in data:
+        data = _DECIMAL_MARK_RE.sub(br'\1', data)
+    return data
+
+
+def _json_loads(data):
+    """Decode a JSON response given as bytes, with floats as Decimal"""
+    if json is not _stdjson:
+        return json.loads(data, parse_float=decimal.Decimal)
+    if _fastjson is not None and not _MAY_HAVE_FLOAT_RE.search(data):
+        return _fastjson.loads(data)
+    return _std_decoder.decode(data.decode('utf8'))
+
+
+# Start of the request body for each method name; None for names that need
+# escaping. Filled in by _call_prefix().
+_call_prefixes = {}
+
 
+def _call_prefix(service_name):
+    if service_name.isascii() and service_name.isidentifier():
+        prefix = (b'{"version": "1.1", "method": "%b", "params": '
+                  % service_name.encode('ascii'))
+    else:
+        prefix = None
+    _call_prefixes[service_name] = prefix
+    return prefix
 
+
+def _get_result(response):
+    """Return the result of a JSON-RPC response, raising JSONRPCError on error"""
+    err = response.get('error')
+    if err is not None:
+        if isinstance(err, dict):
+            raise JSONRPCError(
+                {'code': err.get('code', -345),
+                 'message': err.get('message', 'error message not specified')})
+        raise JSONRPCError({'code': -344, 'message': str(err)})
+    elif 'result' not in response:
+        raise JSONRPCError({
+            'code': -343, 'message': 'missing JSON-RPC result'})
+    else:
+        return response['result']
+
+
+# listunspent fields that are converted; everything else is kept as-is
+_UNSPENT_CONVERTED_KEYS = frozenset(('txid', 'vout', 'address', 'scriptPubKey', 'amount'))
+
+
+def _txid(r):
+    """Return the txid of a transaction-creating asset call, as bytes
+
+    These calls return a list holding the txid as a hex string.
+    """
+    return bytes.fromhex(r[0])[::-1]
+
+
+def _hash_hex(h):
+    """Return hash h as the little-endian hex string used by the RPC interface
+
+    h is normally bytes, but a 64 character hex string (e.g. one taken
+    straight from another RPC reply) is passed through as-is.
+    """
+    if isinstance(h, str) and len(h) == 64:
+        return h
+    try:
+        return h[::-1].hex()
+    except AttributeError:
+        raise TypeError('hash must be bytes; got %r instance' % h.__class__)
+
+
+def _amount(value):
+    """Convert a JSON coin amount to an integer number of satoshis
+
+    Amounts are decoded as Decimal, so shifting the exponent by eight
+    places is exact and skips the multiplication by COIN.
+    """
+    try:
+        return int(value.scaleb(8))
+    except AttributeError:
+        return int(value * COIN)
+
+
+# The default data directory depends only on the platform and the user's
+# home, so it is resolved once per process.
+@functools.lru_cache(maxsize=None)
 def get_tls_datadir(datadir=None):
     if datadir is None:
         if platform.system() == 'Darwin':
@@ -74,12 +232,22 @@ def get_tls_datadir(datadir=None):
     return datadir
 
 
+@functools.lru_cache(maxsize=None)
 def get_tls_conf(datadir=None):
     return os.path.join(get_tls_datadir(datadir), 'telestai.conf')
 
 
+_NUMERIC_RE = re.compile('^[0-9.]+$')
+
+# key=value lines of telestai.conf; anything after a '#' is a comment
+_CONF_LINE_RE = re.compile(r'^([^#=\n]*)=([^#\n]*)', re.MULTILINE)
+
+
 def check_numeric(num):
-    if not re.match('^[0-9.]+$', str(num)):
+    # Non-negative ints are by far the most common argument
+    if type(num) is int and num >= 0:
+        return
+    if not _NUMERIC_RE.match(str(num)):
         raise (ValueError("'{}' is not numeric".format(num)))
 
 
@@ -101,11 +269,9 @@ class JSONRPCError(Exception):
         assert cls is JSONRPCError
         cls = JSONRPCError.SUBCLS_BY_CODE.get(rpc_error['code'], cls)
 
+        # Exception.__init__() sets args to (rpc_error,) once this returns,
+        # so str() is derived from that on demand.
         self = Exception.__new__(cls)
-
-        super(JSONRPCError, self).__init__(
-            'msg: %r  code: %r' %
-            (rpc_error['message'], rpc_error['code']))
         self.error = rpc_error
 
         return self
@@ -146,6 +312,148 @@ class InWarmupError(JSONRPCError):
     RPC_ERROR_CODE = -28
 
 
+def _raise_index_error(*error_classes):
+    """Decorate a Proxy method to re-raise error_classes as IndexError
+
+    The message names the method, as for a missing block or transaction:
+    ``Proxy.getblock(): Block not found (-5)``
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except error_classes as ex:
+                raise IndexError('%s.%s(): %s (%d)' %
+                                 (self.__class__.__name__, method.__name__,
+                                  ex.error['message'], ex.error['code']))
+        return wrapper
+    return decorator
+
+
+class _PipelineSocket(object):
+    """Socket stand-in handed to each HTTPResponse of a pipelined exchange
+
+    HTTPResponse reads through a buffered file from sock.makefile(); bytes it
+    reads ahead may already belong to the next response. Every response gets
+    the same reader here, and closing a response leaves it open.
+    """
+
+    def __init__(self, sock):
+        self.__fp = sock.makefile('rb')
+
+    def makefile(self, mode, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        return getattr(self.__fp, name)
+
+    def close(self):
+        pass
+
+
+class BatchResult(object):
+    """Placeholder for the result of a call queued by BaseProxy.batch()
+
+    result() returns the call's result, or raises its JSONRPCError, once the
+    batch has been sent.
+    """
+
+    __slots__ = ('_response',)
+
+    def __init__(self):
+        self._response = None
+
+    def done(self):
+        return self._response is not None
+
+    def result(self):
+        if self._response is None:
+            raise RuntimeError('batch has not been sent yet')
+        return _get_result(self._response)
+
+    def __repr__(self):
+        if self._response is None:
+            return '<BatchResult pending>'
+        return '<BatchResult %r>' % (self._response,)
+
+
+class _LRUCache(object):
+    """Dict-like cache keeping at most maxsize of the most recently used items
+
+    If ttl is given, items also expire ttl seconds after being stored.
+    """
+
+    def __init__(self, maxsize, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.__items = collections.OrderedDict()
+
+    def __getitem__(self, key):
+        expires, value = self.__items[key]
+        if expires is not None and expires <= time.monotonic():
+            del self.__items[key]
+            raise KeyError(key)
+        self.__items.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if self.maxsize <= 0:
+            return
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        self.__items[key] = (expires, value)
+        self.__items.move_to_end(key)
+        if len(self.__items) > self.maxsize:
+            self.__items.popitem(last=False)
+
+    def __len__(self):
+        return len(self.__items)
+
+    def clear(self):
+        self.__items.clear()
+
+
+def _optional_arg(value, unset=""):
+    """Params for a trailing optional RPC argument: none if it is unset"""
+    if value == unset:
+        return ()
+    return (value,)
+
+
+def _address_list(addrs):
+    """Comma-separated address list param from a string or an iterable"""
+    if isinstance(addrs, str):
+        return addrs
+    return ','.join([str(addr) for addr in addrs])
+
+
+def _cached(method):
+    """Cache the results of a read-only TelestaiProxy lookup by its arguments"""
+    @functools.wraps(method)
+    def cached_method(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            r = self._lookup_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments
+            return method(self, *args, **kwargs)
+        else:
+            if self._batching():
+                # Calls in a batch() block must all return a BatchResult
+                hit = BatchResult()
+                hit._response = {'result': r, 'error': None}
+                return hit
+            return r
+
+        r = method(self, *args, **kwargs)
+        if not isinstance(r, BatchResult):
+            self._lookup_cache[key] = r
+        return r
+    return cached_method
+
+
 class BaseProxy(object):
     """Base JSON-RPC proxy class. Contains only private methods; do not use
     directly."""
@@ -166,15 +474,7 @@ class BaseProxy(object):
         if service_url is None:
             # Figure out the path to the telestai.conf file
             if btc_conf_file is None:
-                if platform.system() == 'Darwin':
-                    btc_conf_file = os.path.expanduser(
-                        '~/Library/Application Support/Telestai/')
-                elif platform.system() == 'Windows':
-                    btc_conf_file = os.path.join(
-                        os.environ['APPDATA'], 'Telestai')
-                else:
-                    btc_conf_file = os.path.expanduser('~/.telestai')
-                btc_conf_file = os.path.join(btc_conf_file, 'telestai.conf')
+                btc_conf_file = get_tls_conf()
 
             # Telestai Core accepts empty rpcuser, not specified in btc_conf_file
             conf = {'rpcuser': ""}
@@ -182,12 +482,7 @@ class BaseProxy(object):
             # Extract contents of telestai.conf to build service_url
             try:
                 with open(btc_conf_file, 'r') as fd:
-                    for line in fd.readlines():
-                        if '#' in line:
-                            line = line[:line.index('#')]
-                        if '=' not in line:
-                            continue
-                        k, v = line.split('=', 1)
+                    for k, v in _CONF_LINE_RE.findall(fd.read()):
                         conf[k.strip()] = v.strip()
 
             # Treat a missing telestai.conf as though it were empty
@@ -218,92 +513,322 @@ class BaseProxy(object):
                         'Cookie file unusable (%s) and rpcpassword not specified in the configuration file: %r' % (
                             err, btc_conf_file))
 
-        else:
-            url = urlparse.urlparse(service_url)
-            authpair = "%s:%s" % (url.username, url.password)
-
         self.__service_url = service_url
-        self.__url = urlparse.urlparse(service_url)
+        self.__url = url = urlparse.urlparse(service_url)
+        if authpair is None:
+            authpair = "%s:%s" % (url.username, url.password)
 
-        if self.__url.scheme not in ('http',):
-            raise ValueError('Unsupported URL scheme %r' % self.__url.scheme)
+        if url.scheme not in ('http', 'https'):
+            raise ValueError('Unsupported URL scheme %r' % url.scheme)
 
-        if self.__url.port is None:
-            port = httplib.HTTP_PORT
+        self.__hostname = url.hostname
+        if url.scheme == 'https':
+            self.__port = url.port or httplib.HTTPS_PORT
         else:
-            port = self.__url.port
+            self.__port = url.port or httplib.HTTP_PORT
         self.__id_count = 0
+        self.__batch = None
+        self.__warm_up_thread = None
+
+        # The request line and headers, including the encoded credentials,
+        # are the same for every call, so they are built once and the same
+        # dict is passed to every request.
+        self.__path = url.path or '/'
+        self.__headers = {
+            'Host': self.__hostname,
+            'User-Agent': DEFAULT_USER_AGENT,
+            'Authorization': b"Basic " + base64.b64encode(authpair.encode('utf8')),
+            'Content-type': 'application/json',
+            'Connection': 'keep-alive',
+        }
 
-        if authpair is None:
-            self.__auth_header = None
-        else:
-            authpair = authpair.encode('utf8')
-            self.__auth_header = b"Basic " + base64.b64encode(authpair)
+        # Request head for pipeline(), which writes requests to the socket
+        # itself; %d is the Content-Length
+        head = b''.join(
+            [b'POST %s HTTP/1.1\r\n' % self.__path.encode('ascii')] +
+            [b'%s: %s\r\n' % (k.encode('ascii'),
+                              v if isinstance(v, bytes) else v.encode('latin-1'))
+             for k, v in self.__headers.items()])
+        self.__pipeline_head = head.replace(b'%', b'%%') + b'Content-Length: %d\r\n\r\n'
 
         if connection:
             self.__conn = connection
+        elif url.scheme == 'https':
+            # Kept alive like a plain connection, so the TLS handshake is only
+            # paid when (re)connecting
+            self.__conn = httplib.HTTPSConnection(self.__hostname, port=self.__port,
+                                                  timeout=timeout)
         else:
-            self.__conn = httplib.HTTPConnection(self.__url.hostname, port=port,
+            self.__conn = httplib.HTTPConnection(self.__hostname, port=self.__port,
                                                  timeout=timeout)
 
     def _call(self, service_name, *args):
         self.__id_count += 1
 
-        postdata = json.dumps({'version': '1.1',
-                               'method': service_name,
-                               'params': args,
-                               'id': self.__id_count})
+        if self.__batch is not None:
+            placeholder = BatchResult()
+            self.__batch.append(({'version': '1.1',
+                                  'method': service_name,
+                                  'params': args,
+                                  'id': self.__id_count},
+                                 placeholder))
+            return placeholder
 
-        headers = {
-            'Host': self.__url.hostname,
-            'User-Agent': DEFAULT_USER_AGENT,
-            'Content-type': 'application/json',
-        }
+        try:
+            prefix = _call_prefixes[service_name]
+        except KeyError:
+            prefix = _call_prefix(service_name)
+        if prefix is not None:
+            # Only the params go through the JSON encoder
+            postdata = (b'%b%b, "id": %d}'
+                        % (prefix, _json_dumps(args) if args else b'[]',
+                           self.__id_count))
+        else:
+            postdata = _json_dumps({'version': '1.1',
+                                    'method': service_name,
+                                    'params': args,
+                                    'id': self.__id_count})
+
+        response = self._request(postdata)
+        return _get_result(response)
+
+    def _call_streaming(self, service_name, *args):
+        """Call service_name and return an iterator over its array result
+
+        For calls with huge results, such as listunspent. If ijson is
+        installed the items are parsed from the response as they are read,
+        so the whole reply is never held in memory; otherwise it is parsed in
+        one go. Nothing else may be sent on this proxy until the iterator is
+        exhausted; abandoning it part way closes the connection.
+        """
+        http_response = self.__post_streaming(service_name, args)
+        if _ijson is None or http_response.status != 200:
+            return iter(_get_result(self._parse_response(http_response)))
+        return self.__stream(http_response, _ijson.items(http_response, 'result.item'))
 
-        if self.__auth_header is not None:
-            headers['Authorization'] = self.__auth_header
+    def _call_streaming_items(self, service_name, *args):
+        """Like _call_streaming(), for a result that is an object
 
-        self.__conn.request('POST', self.__url.path, postdata, headers)
+        Iterates over its (key, value) pairs.
+        """
+        http_response = self.__post_streaming(service_name, args)
+        if _ijson is None or http_response.status != 200:
+            return iter(_get_result(self._parse_response(http_response)).items())
+        return self.__stream(http_response, _ijson.kvitems(http_response, 'result'))
 
-        response = self._get_response()
-        err = response.get('error')
-        if err is not None:
-            if isinstance(err, dict):
-                raise JSONRPCError(
-                    {'code': err.get('code', -345),
-                     'message': err.get('message', 'error message not specified')})
-            raise JSONRPCError({'code': -344, 'message': str(err)})
-        elif 'result' not in response:
-            raise JSONRPCError({
-                'code': -343, 'message': 'missing JSON-RPC result'})
-        else:
-            return response['result']
+    def __post_streaming(self, service_name, args):
+        self.__id_count += 1
+        postdata = _json_dumps({'version': '1.1',
+                                'method': service_name,
+                                'params': args,
+                                'id': self.__id_count})
+
+        # Errors come with a non-200 status and are small, so callers only
+        # stream a successful result.
+        return self.__post(postdata)
+
+    def __stream(self, http_response, items):
+        try:
+            for item in items:
+                yield item
+        finally:
+            if not http_response.isclosed():
+                # Unread data is left on the socket
+                self.__conn.close()
 
     def _batch(self, rpc_call_list):
-        postdata = json.dumps(list(rpc_call_list))
+        postdata = _json_dumps(list(rpc_call_list))
 
-        headers = {
-            'Host': self.__url.hostname,
-            'User-Agent': DEFAULT_USER_AGENT,
-            'Content-type': 'application/json',
-        }
+        return self._request(postdata)
 
-        if self.__auth_header is not None:
-            headers['Authorization'] = self.__auth_header
+    def _batch_call(self, service_name, params_list, batch_size=500):
+        """Call service_name once for each params in params_list
 
-        self.__conn.request('POST', self.__url.path, postdata, headers)
-        return self._get_response()
+        The calls are sent as JSON-RPC batches of up to batch_size calls, one
+        HTTP round trip per batch, which also bounds the response size.
+        Returns the results in the order of params_list; raises JSONRPCError
+        for the first call that failed.
+        """
+        params_list = list(params_list)
+        results = []
+        get_result = _get_result
+        for i in range(0, len(params_list), batch_size):
+            rpc_call_list = [{'version': '1.1',
+                              'method': service_name,
+                              'params': params,
+                              'id': n}
+                             for n, params in enumerate(params_list[i:i + batch_size])]
+            results.extend(map(get_result, self._batch_responses(rpc_call_list)))
+        return results
+
+    def _batch_responses(self, rpc_call_list):
+        """Send rpc_call_list as one batch and return the responses in order
+
+        A call without a response gets an empty dict.
+        """
+        response = self._batch(rpc_call_list)
+        if isinstance(response, dict):
+            # The whole batch was rejected
+            _get_result(response)
+            raise JSONRPCError({
+                'code': -343, 'message': 'missing JSON-RPC batch result'})
+        response_by_id = {r.get('id'): r for r in response}
+        return [response_by_id.get(call['id'], {}) for call in rpc_call_list]
+
+    def _batching(self):
+        """True inside a batch() block"""
+        return self.__batch is not None
+
+    @contextlib.contextmanager
+    def batch(self, batch_size=500):
+        """Queue calls and send them as JSON-RPC batches
+
+        Within the with block, calls made on this proxy are not sent; they
+        return a BatchResult placeholder instead. On leaving the block the
+        queued calls are sent as batches of up to batch_size calls, one HTTP
+        round trip each, and the placeholders filled in:
+
+            with proxy.batch():
+                data = [proxy.getassetdata(name) for name in names]
+            data = [d.result() for d in data]
+
+        Only methods that return the RPC result unchanged can be queued, such
+        as RawProxy calls and TelestaiProxy's asset listing methods. Nothing
+        is sent if the block raises. Nested batch() blocks join the outer one.
+        """
+        if self.__batch is not None:
+            yield self
+            return
+
+        self.__batch = queued = []
+        try:
+            yield self
+        finally:
+            self.__batch = None
+
+        for i in range(0, len(queued), batch_size):
+            chunk = queued[i:i + batch_size]
+            responses = self._batch_responses([call for call, _ in chunk])
+            for (_, placeholder), response in zip(chunk, responses):
+                placeholder._response = response
+
+    def _start_warm_up(self):
+        """Open the connection on a background thread
+
+        Lets the TCP (and TLS) handshake overlap with whatever the caller
+        does before its first call; that call waits for the thread first.
+        Connection errors are ignored here and surface on the first call.
+        """
+        def warm_up():
+            try:
+                self.__conn.connect()
+            except (OSError, httplib.HTTPException):
+                pass
+        self.__warm_up_thread = threading.Thread(target=warm_up, daemon=True)
+        self.__warm_up_thread.start()
+
+    def __wait_warm_up(self):
+        self.__warm_up_thread.join()
+        self.__warm_up_thread = None
+
+    def _request(self, postdata):
+        """POST postdata and return the parsed JSON response"""
+        return self._get_response(self.__post(postdata))
+
+    def __post(self, postdata):
+        """POST postdata and return the HTTP response, unread
+
+        The connection is kept open between calls. If telestaid has closed it
+        in the meantime (idle timeout, restart) the request fails on the stale
+        socket; it is then closed and the request retried once, which makes
+        the connection reconnect. That is only done if sending failed or the
+        connection was closed before any response arrived: a connection lost
+        while reading a response propagates, as the call may have been
+        carried out already and not every call is safe to repeat.
+        """
+        if self.__warm_up_thread is not None:
+            self.__wait_warm_up()
+        try:
+            self.__conn.request('POST', self.__path, postdata, self.__headers)
+        except ConnectionError:
+            self.__conn.close()
+            self.__conn.request('POST', self.__path, postdata, self.__headers)
+            return self.__conn.getresponse()
 
-    def _get_response(self):
-        http_response = self.__conn.getresponse()
+        try:
+            return self.__conn.getresponse()
+        except httplib.RemoteDisconnected:
+            self.__conn.close()
+        self.__conn.request('POST', self.__path, postdata, self.__headers)
+        return self.__conn.getresponse()
+
+    def pipeline(self, calls):
+        """Send several calls at once and return their results in order
+
+        calls is an iterable of (service_name, *args) sequences. All requests
+        are written to the keep-alive connection before any response is read
+        (HTTP/1.1 pipelining), so independent calls cost a single round trip
+        without being bundled into one JSON-RPC batch.
+
+        Only use this for calls that are safe to repeat, such as lookups: on
+        a stale connection the whole pipeline is sent again. Raises
+        JSONRPCError for the first call that failed.
+        """
+        frames = []
+        for call in calls:
+            self.__id_count += 1
+            body = _json_dumps({'version': '1.1',
+                                'method': call[0],
+                                'params': tuple(call[1:]),
+                                'id': self.__id_count})
+            frames.append(self.__pipeline_head % len(body))
+            frames.append(body)
+        if not frames:
+            return []
+        data = b''.join(frames)
+
+        try:
+            responses = self.__pipeline_exchange(data, len(frames) // 2)
+        except (httplib.BadStatusLine, ConnectionError):
+            self.__conn.close()
+            responses = self.__pipeline_exchange(data, len(frames) // 2)
+        return list(map(_get_result, responses))
+
+    def __pipeline_exchange(self, data, count):
+        if self.__warm_up_thread is not None:
+            self.__wait_warm_up()
+        if self.__conn.sock is None:
+            self.__conn.connect()
+        try:
+            self.__conn.sock.sendall(data)
+            sock = _PipelineSocket(self.__conn.sock)
+            responses = []
+            will_close = False
+            for _ in range(count):
+                http_response = httplib.HTTPResponse(sock, method='POST')
+                http_response.begin()
+                responses.append(self._parse_response(http_response))
+                will_close = will_close or http_response.will_close
+        except BaseException:
+            # Unread responses may be left on the socket
+            self.__conn.close()
+            raise
+        if will_close:
+            self.__conn.close()
+        return responses
+
+    def _get_response(self, http_response):
         if http_response is None:
             raise JSONRPCError({
                 'code': -342, 'message': 'missing HTTP response from server'})
+        return self._parse_response(http_response)
 
-        rdata = http_response.read().decode('utf8')
+    def _parse_response(self, http_response):
+        rdata = http_response.read()
         try:
-            return json.loads(rdata, parse_float=decimal.Decimal)
+            return _json_loads(rdata)
         except Exception:
+            rdata = rdata.decode('utf8', 'replace')
             raise JSONRPCError({
                 'code': -342,
                 'message': ('non-JSON HTTP response with \'%i %s\' from server: \'%.20s%s\''
@@ -348,11 +873,14 @@ class RawProxy(BaseProxy):
             raise AttributeError
 
         # Create a callable to do the actual call
-        f = lambda *args: self._call(name, *args)
+        f = functools.partial(self._call, name)
 
-        # Make debuggers show <function telestai.rpc.name> rather than <function
-        # telestai.rpc.<lambda>>
+        # Make debuggers show the RPC method name
         f.__name__ = name
+
+        # Cache it on the instance so later lookups of the same method never
+        # reach __getattr__ again.
+        self.__dict__[name] = f
         return f
 
 
@@ -371,6 +899,7 @@ class Proxy(BaseProxy):
                  service_port=None,
                  btc_conf_file=None,
                  timeout=DEFAULT_HTTP_TIMEOUT,
+                 chain_cache_size=DEFAULT_CHAIN_CACHE_SIZE,
                  **kwargs):
         """Create a proxy object
 
@@ -384,6 +913,10 @@ class Proxy(BaseProxy):
         be used.
 
         ``timeout`` - timeout in seconds before the HTTP interface times out
+
+        ``chain_cache_size`` - number of block hashes, headers and blocks
+        kept by getblockhash(), getblockheader() and getblock(); 0 disables
+        the cache. See invalidate_chain_cache().
         """
 
         super(Proxy, self).__init__(service_url=service_url,
@@ -391,6 +924,17 @@ class Proxy(BaseProxy):
                                     btc_conf_file=btc_conf_file,
                                     timeout=timeout,
                                     **kwargs)
+        self.__chain_cache = _LRUCache(chain_cache_size)
+        self.__tip_height = None
+
+    def invalidate_chain_cache(self):
+        """Forget cached block hashes, headers and blocks
+
+        Blocks are only cached by height once they are CHAIN_CACHE_MIN_DEPTH
+        blocks deep; call this after a deeper reorganization.
+        """
+        self.__chain_cache.clear()
+        self.__tip_height = None
 
     def call(self, service_name, *args):
         """Call an RPC method by name and raw (JSON encodable) arguments"""
@@ -415,13 +959,13 @@ class Proxy(BaseProxy):
          'changepos': Position of added change output, or -1,
         }
         """
-        hextx = hexlify(tx.serialize())
+        hextx = tx.serialize().hex()
         r = self._call('fundrawtransaction', hextx, include_watching)
 
-        r['tx'] = CTransaction.deserialize(unhexlify(r['hex']))
+        r['tx'] = CTransaction.deserialize(bytes.fromhex(r['hex']))
         del r['hex']
 
-        r['fee'] = int(r['fee'] * COIN)
+        r['fee'] = _amount(r['fee'])
 
         return r
 
@@ -436,7 +980,7 @@ class Proxy(BaseProxy):
         Returns iterable of block hashes generated.
         """
         r = self._call('generate', numblocks)
-        return (lx(blk_hash) for blk_hash in r)
+        return map(lx, r)
 
     def generatetoaddress(self, numblocks, addr):
         """Mine blocks immediately (before the RPC call returns) and
@@ -449,7 +993,7 @@ class Proxy(BaseProxy):
         Returns iterable of block hashes generated.
         """
         r = self._call('generatetoaddress', numblocks, str(addr))
-        return (lx(blk_hash) for blk_hash in r)
+        return map(lx, r)
 
     def getaccountaddress(self, account=None):
         """Return the current Telestai address for receiving payments to this
@@ -470,12 +1014,13 @@ class Proxy(BaseProxy):
         (default=False)
         """
         r = self._call('getbalance', account, minconf, include_watchonly)
-        return int(r * COIN)
+        return _amount(r)
 
     def getbestblockhash(self):
         """Return hash of best (tip) block in longest block chain."""
         return lx(self._call('getbestblockhash'))
 
+    @_raise_index_error(InvalidAddressOrKeyError)
     def getblockheader(self, block_hash, verbose=False):
         """Get block header <block_hash>
 
@@ -486,15 +1031,17 @@ class Proxy(BaseProxy):
         Raises IndexError if block_hash is not valid.
         """
         try:
-            block_hash = b2lx(block_hash)
+            block_hash = _hash_hex(block_hash)
         except TypeError:
             raise TypeError('%s.getblockheader(): block_hash must be bytes; got %r instance' %
                             (self.__class__.__name__, block_hash.__class__))
-        try:
-            r = self._call('getblockheader', block_hash, verbose)
-        except InvalidAddressOrKeyError as ex:
-            raise IndexError('%s.getblockheader(): %s (%d)' %
-                             (self.__class__.__name__, ex.error['message'], ex.error['code']))
+        if not verbose:
+            key = ('getblockheader', block_hash)
+            try:
+                return self.__chain_cache[key]
+            except KeyError:
+                pass
+        r = self._call('getblockheader', block_hash, verbose)
 
         if verbose:
             nextblockhash = None
@@ -506,50 +1053,104 @@ class Proxy(BaseProxy):
                     'nextblockhash': nextblockhash,
                     'chainwork': x(r['chainwork'])}
         else:
-            return CBlockHeader.deserialize(unhexlify(r))
+            header = CBlockHeader.deserialize(bytes.fromhex(r))
+            self.__chain_cache[key] = header
+            return header
 
+    @_raise_index_error(InvalidAddressOrKeyError)
     def getblock(self, block_hash):
         """Get block <block_hash>
 
         Raises IndexError if block_hash is not valid.
         """
         try:
-            block_hash = b2lx(block_hash)
+            block_hash = _hash_hex(block_hash)
         except TypeError:
             raise TypeError('%s.getblock(): block_hash must be bytes; got %r instance' %
                             (self.__class__.__name__, block_hash.__class__))
+        # With this change ( https://github.com/telestai/telestai/commit/96c850c20913b191cff9f66fedbb68812b1a41ea#diff-a0c8f511d90e83aa9b5857e819ced344 ),
+        # telestai core's rpc takes 0/1/2 instead of true/false as the 2nd argument which specifies verbosity, since v0.15.0.
+        # The change above is backward-compatible so far; the old "false" is taken as the new "0".
+        key = ('getblock', block_hash)
         try:
-            # With this change ( https://github.com/telestai/telestai/commit/96c850c20913b191cff9f66fedbb68812b1a41ea#diff-a0c8f511d90e83aa9b5857e819ced344 ),
-            # telestai core's rpc takes 0/1/2 instead of true/false as the 2nd argument which specifies verbosity, since v0.15.0.
-            # The change above is backward-compatible so far; the old "false" is taken as the new "0".
-            r = self._call('getblock', block_hash, False)
-        except InvalidAddressOrKeyError as ex:
-            raise IndexError('%s.getblock(): %s (%d)' %
-                             (self.__class__.__name__, ex.error['message'], ex.error['code']))
-        return CBlock.deserialize(unhexlify(r))
+            return self.__chain_cache[key]
+        except KeyError:
+            pass
+        r = self._call('getblock', block_hash, False)
+        block = CBlock.deserialize(bytes.fromhex(r))
+        self.__chain_cache[key] = block
+        return block
 
     def getblockcount(self):
         """Return the number of blocks in the longest block chain"""
-        return self._call('getblockcount')
+        r = self._call('getblockcount')
+        if isinstance(r, int):
+            # Not a BatchResult
+            self.__tip_height = r
+        return r
 
+    @_raise_index_error(InvalidParameterError)
     def getblockhash(self, height):
         """Return hash of block in best-block-chain at height.
 
         Raises IndexError if height is not valid.
         """
+        key = ('getblockhash', height)
         try:
-            return lx(self._call('getblockhash', height))
-        except InvalidParameterError as ex:
-            raise IndexError('%s.getblockhash(): %s (%d)' %
-                             (self.__class__.__name__, ex.error['message'], ex.error['code']))
+            return self.__chain_cache[key]
+        except KeyError:
+            pass
+
+        block_hash = lx(self._call('getblockhash', height))
+        if self.__chain_cache.maxsize > 0:
+            # The block exists, so the tip is at least that high
+            if self.__tip_height is None or self.__tip_height < height:
+                self.__tip_height = height
+            if self.__tip_height - height < CHAIN_CACHE_MIN_DEPTH:
+                # It may only look shallow because the known tip is stale
+                self.getblockcount()
+            if self.__tip_height - height >= CHAIN_CACHE_MIN_DEPTH:
+                self.__chain_cache[key] = block_hash
+        return block_hash
+
+    @_raise_index_error(InvalidParameterError)
+    def getblockhashes(self, heights, batch_size=500):
+        """Return hashes of the blocks in best-block-chain at heights
+
+        Like getblockhash(), but the calls are sent as JSON-RPC batches of up
+        to batch_size heights, one round trip per batch.
+
+        Raises IndexError if any height is not valid.
+        """
+        r = self._batch_call('getblockhash', ([h] for h in heights), batch_size)
+        return list(map(lx, r))
+
+    @_raise_index_error(InvalidAddressOrKeyError)
+    def getblockheaders(self, block_hashes, batch_size=500):
+        """Return the headers of the blocks with the given hashes
+
+        Like getblockheader(), but the calls are sent as JSON-RPC batches of
+        up to batch_size hashes, one round trip per batch.
+
+        Raises IndexError if any block hash is not valid.
+        """
+        try:
+            params_list = [[_hash_hex(h), False] for h in block_hashes]
+        except TypeError:
+            raise TypeError('%s.getblockheaders(): block hashes must be bytes' %
+                            self.__class__.__name__)
+        r = self._batch_call('getblockheader', params_list, batch_size)
+        deserialize = CBlockHeader.deserialize
+        unhexlify = bytes.fromhex
+        return [deserialize(unhexlify(h)) for h in r]
 
     def getinfo(self):
         """Return a JSON object containing various state info"""
         r = self._call('getinfo')
         if 'balance' in r:
-            r['balance'] = int(r['balance'] * COIN)
+            r['balance'] = _amount(r['balance'])
         if 'paytxfee' in r:
-            r['paytxfee'] = int(r['paytxfee'] * COIN)
+            r['paytxfee'] = _amount(r['paytxfee'])
         return r
 
     def getmininginfo(self):
@@ -585,9 +1186,10 @@ class Proxy(BaseProxy):
 
         else:
             r = self._call('getrawmempool')
-            r = [lx(txid) for txid in r]
+            r = list(map(lx, r))
             return r
 
+    @_raise_index_error(InvalidAddressOrKeyError)
     def getrawtransaction(self, txid, verbose=False):
         """Return transaction with hash txid
 
@@ -599,14 +1201,10 @@ class Proxy(BaseProxy):
         Note that if all txouts are spent and the transaction index is not
         enabled the transaction may not be available.
         """
-        try:
-            r = self._call('getrawtransaction', b2lx(
-                txid), 1 if verbose else 0)
-        except InvalidAddressOrKeyError as ex:
-            raise IndexError('%s.getrawtransaction(): %s (%d)' %
-                             (self.__class__.__name__, ex.error['message'], ex.error['code']))
+        r = self._call('getrawtransaction', _hash_hex(txid),
+                       1 if verbose else 0)
         if verbose:
-            r['tx'] = CTransaction.deserialize(unhexlify(r['hex']))
+            r['tx'] = CTransaction.deserialize(bytes.fromhex(r['hex']))
             del r['hex']
             del r['txid']
             del r['version']
@@ -615,7 +1213,7 @@ class Proxy(BaseProxy):
             del r['vout']
             r['blockhash'] = lx(r['blockhash']) if 'blockhash' in r else None
         else:
-            r = CTransaction.deserialize(unhexlify(r))
+            r = CTransaction.deserialize(bytes.fromhex(r))
 
         return r
 
@@ -634,8 +1232,9 @@ class Proxy(BaseProxy):
         (default=1)
         """
         r = self._call('getreceivedbyaddress', str(addr), minconf)
-        return int(r * COIN)
+        return _amount(r)
 
+    @_raise_index_error(InvalidAddressOrKeyError)
     def gettransaction(self, txid):
         """Get detailed information about in-wallet transaction txid
 
@@ -643,11 +1242,7 @@ class Proxy(BaseProxy):
 
         FIXME: Returned data types are not yet converted.
         """
-        try:
-            r = self._call('gettransaction', b2lx(txid))
-        except InvalidAddressOrKeyError as ex:
-            raise IndexError('%s.getrawtransaction(): %s (%d)' %
-                             (self.__class__.__name__, ex.error['message'], ex.error['code']))
+        r = self._call('gettransaction', _hash_hex(txid))
         return r
 
     def gettxout(self, outpoint, includemempool=True):
@@ -657,15 +1252,15 @@ class Proxy(BaseProxy):
 
         includemempool - Include mempool txouts
         """
-        r = self._call('gettxout', b2lx(outpoint.hash),
+        r = self._call('gettxout', _hash_hex(outpoint.hash),
                        outpoint.n, includemempool)
 
         if r is None:
             raise IndexError('%s.gettxout(): unspent txout %r not found' % (
                 self.__class__.__name__, outpoint))
 
-        r['txout'] = CTxOut(int(r['value'] * COIN),
-                            CScript(unhexlify(r['scriptPubKey']['hex'])))
+        r['txout'] = CTxOut(_amount(r['value']),
+                            CScript(bytes.fromhex(r['scriptPubKey']['hex'])))
         del r['value']
         del r['scriptPubKey']
         r['bestblock'] = lx(r['bestblock'])
@@ -692,29 +1287,35 @@ class Proxy(BaseProxy):
             addrs = [str(addr) for addr in addrs]
             r = self._call('listunspent', minconf, maxconf, addrs)
 
+        # Local names for everything used in the loop, which runs once per
+        # wallet txout
+        _lx = lx
+        _COutPoint = COutPoint
+        _CScript = CScript
+        _CTelestaiAddress = CTelestaiAddress
+        _unhexlify = bytes.fromhex
+        _amount_ = _amount
+        converted_keys = _UNSPENT_CONVERTED_KEYS
+
         r2 = []
-        for unspent in r:
-            unspent['outpoint'] = COutPoint(
-                lx(unspent['txid']), unspent['vout'])
-            del unspent['txid']
-            del unspent['vout']
+        append = r2.append
+        for u in r:
+            unspent = {k: v for k, v in u.items() if k not in converted_keys}
+            unspent['outpoint'] = _COutPoint(_lx(u['txid']), u['vout'])
 
             # address isn't always available as Telestai Core allows scripts w/o
             # an address type to be imported into the wallet, e.g. non-p2sh
             # segwit
-            try:
-                unspent['address'] = CTelestaiAddress(unspent['address'])
-            except KeyError:
-                pass
-            unspent['scriptPubKey'] = CScript(
-                unhexlify(unspent['scriptPubKey']))
-            unspent['amount'] = int(unspent['amount'] * COIN)
-            r2.append(unspent)
+            if 'address' in u:
+                unspent['address'] = _CTelestaiAddress(u['address'])
+            unspent['scriptPubKey'] = _CScript(_unhexlify(u['scriptPubKey']))
+            unspent['amount'] = _amount_(u['amount'])
+            append(unspent)
         return r2
 
     def lockunspent(self, unlock, outpoints):
         """Lock or unlock outpoints"""
-        json_outpoints = [{'txid': b2lx(outpoint.hash), 'vout': outpoint.n}
+        json_outpoints = [{'txid': outpoint.hash[::-1].hex(), 'vout': outpoint.n}
                           for outpoint in outpoints]
         return self._call('lockunspent', unlock, json_outpoints)
 
@@ -723,7 +1324,7 @@ class Proxy(BaseProxy):
 
         allowhighfees - Allow even if fees are unreasonably high.
         """
-        hextx = hexlify(tx.serialize())
+        hextx = tx.serialize().hex()
         r = None
         if allowhighfees:
             r = self._call('sendrawtransaction', hextx, True)
@@ -757,9 +1358,9 @@ class Proxy(BaseProxy):
 
         FIXME: implement options
         """
-        hextx = hexlify(tx.serialize())
+        hextx = tx.serialize().hex()
         r = self._call('signrawtransaction', hextx, *args)
-        r['tx'] = CTransaction.deserialize(unhexlify(r['hex']))
+        r['tx'] = CTransaction.deserialize(bytes.fromhex(r['hex']))
         del r['hex']
         return r
 
@@ -769,9 +1370,9 @@ class Proxy(BaseProxy):
 
         FIXME: implement options
         """
-        hextx = hexlify(tx.serialize())
+        hextx = tx.serialize().hex()
         r = self._call('signrawtransactionwithwallet', hextx, *args)
-        r['tx'] = CTransaction.deserialize(unhexlify(r['hex']))
+        r['tx'] = CTransaction.deserialize(bytes.fromhex(r['hex']))
         del r['hex']
         return r
 
@@ -781,7 +1382,7 @@ class Proxy(BaseProxy):
         params is optional and is currently ignored by telestaid. See
         https://en.telestai.it/wiki/BIP_0022 for full specification.
         """
-        hexblock = hexlify(block.serialize())
+        hexblock = block.serialize().hex()
         if params is not None:
             return self._call('submitblock', hexblock, params)
         else:
@@ -793,7 +1394,7 @@ class Proxy(BaseProxy):
         if r['isvalid']:
             r['address'] = CTelestaiAddress(r['address'])
         if 'pubkey' in r:
-            r['pubkey'] = unhexlify(r['pubkey'])
+            r['pubkey'] = bytes.fromhex(r['pubkey'])
         return r
 
     def unlockwallet(self, password, timeout=60):
@@ -837,7 +1438,8 @@ class TelestaiRawProxy(RawProxy):
         super(TelestaiRawProxy, self).__init__(service_url=service_url,
                                             service_port=service_port,
                                             btc_conf_file=tls_conf_file,
-                                            timeout=timeout)
+                                            timeout=timeout,
+                                            **kwargs)
 
 
 class TelestaiProxy(Proxy):
@@ -847,7 +1449,21 @@ class TelestaiProxy(Proxy):
                  tls_conf_file=None,
                  timeout=DEFAULT_HTTP_TIMEOUT,
                  datadir=None,
+                 lookup_cache_size=DEFAULT_LOOKUP_CACHE_SIZE,
+                 lookup_cache_ttl=DEFAULT_LOOKUP_CACHE_TTL,
+                 warm_up=False,
                  **kwargs):
+        """Create a proxy object
+
+        Read-only asset and restriction lookups (getassetdata,
+        checkaddresstag, ...) are cached for up to lookup_cache_ttl seconds,
+        keeping at most lookup_cache_size results; 0 disables the cache. Call
+        invalidate_cache() when a new block arrives. Cached results are
+        shared between callers, so do not modify them.
+
+        With warm_up the connection to telestaid is opened on a background
+        thread right away, so the first call does not pay for it.
+        """
 
         if service_url is None:
             if tls_conf_file is None:
@@ -856,7 +1472,15 @@ class TelestaiProxy(Proxy):
         super(TelestaiProxy, self).__init__(service_url=service_url,
                                          service_port=service_port,
                                          btc_conf_file=tls_conf_file,
-                                         timeout=timeout)
+                                         timeout=timeout,
+                                         **kwargs)
+        self._lookup_cache = _LRUCache(lookup_cache_size, ttl=lookup_cache_ttl)
+        if warm_up:
+            self._start_warm_up()
+
+    def invalidate_cache(self):
+        """Forget cached asset and restriction lookups"""
+        self._lookup_cache.clear()
 
     """ Telestai asset support """
 
@@ -869,8 +1493,7 @@ class TelestaiProxy(Proxy):
         check_numeric(qty)
         r = self._call('issue', str(asset_name), qty, str(to_address), str(change_address), int(units), reissuable,
                        has_ipfs, ipfs_hash)
-        txid = r[0]
-        return lx(txid)
+        return _txid(r)
 
     def issueunique(self, root_name, asset_tags, ipfs_hashes=None, to_address="", change_address=""):
         """Creates a unique asset from a pool of assets with a specific name.
@@ -879,8 +1502,7 @@ class TelestaiProxy(Proxy):
         asset_tags_str = [str(x) for x in asset_tags]
         r = self._call('issueunique', str(root_name), asset_tags_str,
                        ipfs_hashes, str(to_address), str(change_address))
-        txid = r[0]
-        return lx(txid)
+        return _txid(r)
 
     def reissue(self, reissue_asset_name, qty, to_address, change_address="", reissuable=True, new_unit=-1,
                 new_ipfs=None):
@@ -888,21 +1510,15 @@ class TelestaiProxy(Proxy):
         and if the reissuable flag was set to true at the time of original issuance."""
         new_unit = int(new_unit)
         check_numeric(qty)
-        if new_ipfs is not None:
-            r = self._call('reissue', str(reissue_asset_name), qty, str(to_address), str(change_address), reissuable,
-                           new_unit, new_ipfs)
-        else:
-            r = self._call('reissue', str(reissue_asset_name), qty, str(to_address), str(change_address), reissuable,
-                           new_unit)
-        txid = r[0]
-        return lx(txid)
+        r = self._call('reissue', str(reissue_asset_name), qty, str(to_address), str(change_address), reissuable,
+                       new_unit, *_optional_arg(new_ipfs, None))
+        return _txid(r)
 
     def transfer(self, asset_name, qty, to_address):
         """This sends assets from one asset holder to another"""
         check_numeric(qty)
         r = self._call('transfer', str(asset_name), qty, str(to_address))
-        txid = r[0]
-        return lx(txid)
+        return _txid(r)
 
     def listassets(self, assets="*", verbose=False, count=2147483647, start=0):
         """This lists assets that have already been created"""
@@ -914,16 +1530,36 @@ class TelestaiProxy(Proxy):
         r = self._call('listmyassets', asset, verbose, count, start)
         return r
 
+    def iter_listassets(self, assets="*", count=2147483647, start=0):
+        """Iterate over (asset_name, metadata) pairs of the created assets
+
+        Like listassets(verbose=True), but with ijson installed the assets are
+        parsed as they are read from the connection instead of building one
+        large dict; see BaseProxy._call_streaming(). The iteration may be
+        stopped early.
+        """
+        return self._call_streaming_items('listassets', assets, True, count, start)
+
+    def iter_listmyassets(self, asset="*", verbose=False, count=2147483647, start=0):
+        """Iterate over (asset_name, balance) pairs of your assets
+
+        Like listmyassets(); with verbose the values are dicts with the
+        balance and outpoints.
+        """
+        return self._call_streaming_items('listmyassets', asset, verbose, count, start)
+
     def listassetbalancesbyaddress(self, address):
         """Lists asset balance by address"""
         r = self._call('listassetbalancesbyaddress', str(address))
         return r
 
+    @_cached
     def listaddressesbyasset(self, asset_name):
         """Lists addresses by asset"""
         r = self._call('listaddressesbyasset', str(asset_name))
         return r
 
+    @_cached
     def getassetdata(self, asset_name):
         """Lists asset data of an asset"""
         r = self._call('getassetdata', str(asset_name))
@@ -938,8 +1574,17 @@ class TelestaiProxy(Proxy):
 
     def transferfromaddresses(self, asset_name, from_addresses, qty, to_address, message="",
                               expire_time=0, tls_change_address="", asset_change_address=""):
+        """Transfer an asset from the given addresses
+
+        from_addresses - list of addresses to send from; a single address is
+        also accepted
+        """
         check_numeric(qty)
-        r = self._call('transferfromaddresses', str(asset_name), str(from_addresses), qty, str(to_address),
+        if isinstance(from_addresses, str):
+            from_addresses = [from_addresses]
+        # Sent as a JSON array, which is what telestaid expects
+        from_addresses = [str(addr) for addr in from_addresses]
+        r = self._call('transferfromaddresses', str(asset_name), from_addresses, qty, str(to_address),
                        str(message),
                        int(expire_time), str(tls_change_address), str(asset_change_address))
         return r
@@ -951,45 +1596,37 @@ class TelestaiProxy(Proxy):
     """ Restricted assets """
 
     def addtagtoaddress(self, tag_name, to_address, change_address="", asset_data=""):
-        if asset_data == "":
-            r = self._call('addtagtoaddress', str(tag_name),
-                           str(to_address), str(change_address))
-        else:
-            r = self._call('addtagtoaddress', str(tag_name), str(
-                to_address), str(change_address), str(asset_data))
-        txid = r[0]
-        return lx(txid)
+        r = self._call('addtagtoaddress', str(tag_name), str(to_address),
+                       str(change_address), *_optional_arg(str(asset_data)))
+        return _txid(r)
 
+    @_cached
     def checkaddressrestriction(self, address, restricted_name):
         r = self._call('checkaddressrestriction',
                        str(address), str(restricted_name))
         return r
 
+    @_cached
     def checkaddresstag(self, address, tag_name):
         r = self._call('checkaddresstag', str(address), str(tag_name))
         return r
 
+    @_cached
     def checkglobalrestriction(self, restricted_name):
         r = self._call('checkglobalrestriction', str(restricted_name))
         return r
 
     def freezeaddress(self, asset_name, address, change_address="", asset_data=""):
-        if asset_data == "":
-            r = self._call('freezeaddress', str(asset_name),
-                           str(address), str(change_address))
-        else:
-            r = self._call('freezeaddress', str(asset_name), str(
-                address), str(change_address), str(asset_data))
+        r = self._call('freezeaddress', str(asset_name), str(address),
+                       str(change_address), *_optional_arg(str(asset_data)))
         return r
 
     def freezerestrictedasset(self, asset_name, change_address="", asset_data=""):
-        if asset_data == "":
-            r = self._call('freezerestrictedasset', asset_name, change_address)
-        else:
-            r = self._call('freezerestrictedasset', asset_name,
-                           change_address, asset_data)
+        r = self._call('freezerestrictedasset', asset_name, change_address,
+                       *_optional_arg(asset_data))
         return r
 
+    @_cached
     def getverifierstring(self, restricted_name):
         r = self._call('getverifierstring', str(restricted_name))
         return r
@@ -997,28 +1634,20 @@ class TelestaiProxy(Proxy):
     def issuequalifierasset(self, asset_name, qty=1, to_address="", change_address="", has_ipfs=False, ipfs_hash=""):
         check_numeric(qty)
         has_ipfs = bool(has_ipfs)
-        if has_ipfs:
-            r = self._call('issuequalifierasset', str(asset_name), qty, str(to_address), str(change_address),
-                           has_ipfs, str(ipfs_hash))
-        else:
-            r = self._call('issuequalifierasset', str(asset_name), qty, str(to_address), str(change_address),
-                           has_ipfs)
-        txid = r[0]
-        return lx(txid)
+        r = self._call('issuequalifierasset', str(asset_name), qty, str(to_address), str(change_address),
+                       has_ipfs, *_optional_arg(str(ipfs_hash) if has_ipfs else None, None))
+        return _txid(r)
 
     def issuerestrictedasset(self, asset_name, qty, verifier, to_address, change_address="", units=0, reissuable=True,
                              has_ipfs=False, ipfs_hash=""):
         check_numeric(qty)
         has_ipfs = bool(has_ipfs)
-        if has_ipfs:
-            r = self._call('issuerestrictedasset', str(asset_name), qty, str(verifier), str(to_address),
-                           str(change_address), int(units), bool(reissuable), has_ipfs, str(ipfs_hash))
-        else:
-            r = self._call('issuerestrictedasset', str(asset_name), qty, str(verifier), str(to_address),
-                           str(change_address), int(units), bool(reissuable), has_ipfs)
-        txid = r[0]
-        return lx(txid)
+        r = self._call('issuerestrictedasset', str(asset_name), qty, str(verifier), str(to_address),
+                       str(change_address), int(units), bool(reissuable), has_ipfs,
+                       *_optional_arg(str(ipfs_hash) if has_ipfs else None, None))
+        return _txid(r)
 
+    @_cached
     def isvalidverifierstring(self, verifier_string):
         r = self._call('isvalidverifierstring', str(verifier_string))
         return r
@@ -1047,12 +1676,8 @@ class TelestaiProxy(Proxy):
         return r
 
     def removetagfromaddress(self, tag_name, to_address, change_address="", asset_data=""):
-        if asset_data == "":
-            r = self._call('removetagfromaddress', str(tag_name),
-                           str(to_address), str(change_address))
-        else:
-            r = self._call('removetagfromaddress', str(tag_name), str(
-                to_address), str(change_address), str(asset_data))
+        r = self._call('removetagfromaddress', str(tag_name), str(to_address),
+                       str(change_address), *_optional_arg(str(asset_data)))
         return r
 
     def transferqualifier(self, qualifier_name, qty, to_address, change_address="", message="", expire_time=0):
@@ -1062,21 +1687,13 @@ class TelestaiProxy(Proxy):
         return r
 
     def unfreezeaddress(self, asset_name, address, change_address="", asset_data=""):
-        if asset_data == "":
-            r = self._call('unfreezeaddress', str(asset_name),
-                           str(address), str(change_address))
-        else:
-            r = self._call('unfreezeaddress', str(asset_name), str(
-                address), str(change_address), str(asset_data))
+        r = self._call('unfreezeaddress', str(asset_name), str(address),
+                       str(change_address), *_optional_arg(str(asset_data)))
         return r
 
     def unfreezerestrictedasset(self, asset_name, change_address="", asset_data=""):
-        if asset_data == "":
-            r = self._call('unfreezerestrictedasset', str(
-                asset_name), str(change_address))
-        else:
-            r = self._call('unfreezerestrictedasset', str(
-                asset_name), str(change_address), str(asset_data))
+        r = self._call('unfreezerestrictedasset', str(asset_name),
+                       str(change_address), *_optional_arg(str(asset_data)))
         return r
 
     def viewmyrestrictedaddresses(self):
@@ -1106,13 +1723,13 @@ class TelestaiProxy(Proxy):
                          exception_addresses="", change_address="", dry_run=False):
         r = self._call('distributereward', str(asset_name), int(snapshot_height), str(distribution_asset_name),
                        gross_distribution_amount,
-                       str(exception_addresses), str(change_address), bool(dry_run))
+                       _address_list(exception_addresses), str(change_address), bool(dry_run))
         return r
 
     def getdistributestatus(self, asset_name, snapshot_height, distribution_asset_name, gross_distribution_amount,
                             exception_addresses=""):
         r = self._call('getdistributestatus', str(asset_name), int(snapshot_height), str(distribution_asset_name),
-                       gross_distribution_amount, str(exception_addresses))
+                       gross_distribution_amount, _address_list(exception_addresses))
         return r
 
     def getsnapshotrequest(self, asset_name, block_height):
@@ -1160,6 +1777,111 @@ class TelestaiProxy(Proxy):
         return r
 
 
+class ThreadedProxyPool(object):
+    """Run independent RPC calls concurrently, one connection per thread
+
+    A proxy holds a single HTTP connection and so can only have one request
+    in flight. The pool owns ``n`` proxies of ``proxy_class``, created with
+    ``proxy_kwargs``, and a thread pool of the same size; each call borrows a
+    proxy for its duration. Use it for many unrelated calls where waiting on
+    each round trip in turn would dominate::
+
+        with ThreadedProxyPool(8, TelestaiProxy) as pool:
+            txs = pool.map(lambda proxy, txid: proxy.getrawtransaction(txid), txids)
+    """
+
+    def __init__(self, n=4, proxy_class=None, **proxy_kwargs):
+        if proxy_class is None:
+            proxy_class = Proxy
+        self.__proxies = queue.Queue()
+        for _ in range(n):
+            self.__proxies.put(proxy_class(**proxy_kwargs))
+        self.__executor = ThreadPoolExecutor(max_workers=n)
+
+    def _with_proxy(self, func, *args):
+        proxy = self.__proxies.get()
+        try:
+            return func(proxy, *args)
+        finally:
+            self.__proxies.put(proxy)
+
+    def submit(self, func, *args):
+        """Schedule func(proxy, *args) and return its concurrent.futures.Future"""
+        return self.__executor.submit(self._with_proxy, func, *args)
+
+    def map(self, func, *iterables):
+        """Return [func(proxy, *args) ...] over iterables, like map()
+
+        Calls run concurrently; results are in the order of the arguments.
+        The first exception raised by a call is re-raised.
+        """
+        return list(self.__executor.map(
+            functools.partial(self._with_proxy, func), *iterables))
+
+    def map_call(self, service_name, args_iter):
+        """Call the raw RPC service_name(*args) for each args in args_iter
+
+        Returns the JSON results in order, as ``_call`` would.
+        """
+        return self.map(lambda proxy, args: proxy._call(service_name, *args),
+                        args_iter)
+
+    def close(self):
+        self.__executor.shutdown()
+        while not self.__proxies.empty():
+            self.__proxies.get().close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncTelestaiProxy(object):
+    """asyncio front end to TelestaiProxy
+
+    Every TelestaiProxy method is available as a coroutine function taking the
+    same arguments, so independent calls can overlap::
+
+        async with AsyncTelestaiProxy(8) as proxy:
+            data = await asyncio.gather(*[proxy.getassetdata(n) for n in names])
+
+    Calls run on a ThreadedProxyPool of ``n`` keep-alive connections, which
+    bounds how many requests are in flight at once; the event loop itself is
+    never blocked on the network.
+    """
+
+    def __init__(self, n=4, proxy_class=None, **proxy_kwargs):
+        if proxy_class is None:
+            proxy_class = TelestaiProxy
+        self.__pool = ThreadedProxyPool(n, proxy_class, **proxy_kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            # Python internal stuff
+            raise AttributeError(name)
+
+        pool = self.__pool
+
+        async def method(*args, **kwargs):
+            return await asyncio.wrap_future(pool.submit(
+                lambda proxy: getattr(proxy, name)(*args, **kwargs)))
+
+        method.__name__ = name
+        self.__dict__[name] = method
+        return method
+
+    def close(self):
+        self.__pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
 __all__ = (
     'JSONRPCError',
     'ForbiddenBySafeModeError',
@@ -1173,4 +1895,7 @@ __all__ = (
     'Proxy',
     'TelestaiRawProxy',
     'TelestaiProxy',
+    'ThreadedProxyPool',
+    'AsyncTelestaiProxy',
+    'BatchResult',
 )
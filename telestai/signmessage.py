@@ -13,18 +13,14 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 from telestai.core.key import CPubKey
-from telestai.core.serialize import ImmutableSerializable
+from telestai.core.serialize import ImmutableSerializable, VarIntSerializer
 from telestai.wallet import P2PKHTelestaiAddress
 import telestai
 import base64
-import sys
+import hashlib
+import os
 
-_bchr = chr
-_bord = ord
-if sys.version > '3':
-    long = int
-    def _bchr(x): return bytes([x])
-    def _bord(x): return x
+from concurrent.futures import ThreadPoolExecutor
 
 
 def VerifyMessage(address, message, sig):
@@ -36,23 +32,79 @@ def VerifyMessage(address, message, sig):
     return str(P2PKHTelestaiAddress.from_pubkey(pubkey)) == str(address)
 
 
-def SignMessage(key, message):
-    sig, i = key.sign_compact(message.GetHash())
+def _verify_message_item(item):
+    return VerifyMessage(*item)
+
+
+def VerifyMessages(items, max_workers=None):
+    """Verify many (address, message, sig) items; return a list of bools
+
+    Public key recovery runs in OpenSSL through ctypes, which releases the
+    GIL, so the items are spread over max_workers threads (default: one per
+    CPU).
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 1 or len(items) < 2:
+        return [VerifyMessage(*item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_verify_message_item, items))
+
+
+def _sign_compact(key, hash):
+    sig, i = key.sign_compact(hash)
 
     meta = 27 + i
     if key.is_compressed:
         meta += 4
 
-    return base64.b64encode(_bchr(meta) + sig)
+    return bytes((meta,)) + sig
+
+
+def SignMessage(key, message):
+    return base64.b64encode(_sign_compact(key, message.GetHash()))
+
+
+def SignAndVerifyMessage(key, message):
+    """Sign message and check the signature before returning it
+
+    Same result as SignMessage(), but the public key is recovered from the
+    raw signature, reusing the message hash and skipping the base64 round
+    trip of a separate VerifyMessage(). Raises ValueError if it does not
+    match key.
+    """
+    hash = message.GetHash()
+    sig = _sign_compact(key, hash)
+    if CPubKey.recover_compact(hash, sig) != key.pub:
+        raise ValueError('signature does not verify against the signing key')
+    return base64.b64encode(sig)
+
+
+_DEFAULT_MAGIC = b"Telestai Signed Message:\n"
+
+
+def _ser_bytes(b):
+    """BytesSerializer.serialize(b) without going through a BytesIO"""
+    if len(b) < 0xfd:
+        return bytes((len(b),)) + b
+    return VarIntSerializer.serialize(len(b)) + b
 
 
 class TelestaiMessage(ImmutableSerializable):
     __slots__ = ['magic', 'message']
 
     # messagePrefix: '\x19Telestai Signed Message:\n', -> messagePrefix: '\x19Telestai Signed Message:\n',
-    def __init__(self, message="", magic="Telestai Signed Message:\n"):
-        object.__setattr__(self, 'message', message.encode("utf-8"))
-        object.__setattr__(self, 'magic', magic.encode("utf-8"))
+    def __init__(self, message="", magic=None):
+        """message and magic may be str (UTF-8 encoded) or bytes"""
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        if magic is None:
+            magic = _DEFAULT_MAGIC
+        elif isinstance(magic, str):
+            magic = magic.encode("utf-8")
+        object.__setattr__(self, 'message', message)
+        object.__setattr__(self, 'magic', magic)
 
     @classmethod
     def stream_deserialize(cls, f):
@@ -67,6 +119,22 @@ class TelestaiMessage(ImmutableSerializable):
         telestai.core.serialize.BytesSerializer.stream_serialize(
             self.message, f)
 
+    def GetHash(self):
+        """Return the hash of the serialized message
+
+        Same as ImmutableSerializable.GetHash(), including the caching, but
+        hashes magic and message directly rather than serializing to a stream
+        first.
+        """
+        try:
+            return self._cached_GetHash
+        except AttributeError:
+            pass
+        data = _ser_bytes(self.magic) + _ser_bytes(self.message)
+        h = hashlib.sha256(hashlib.sha256(data).digest()).digest()
+        object.__setattr__(self, '_cached_GetHash', h)
+        return h
+
     def __str__(self):
         return self.message.decode('ascii')
 
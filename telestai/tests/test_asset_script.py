@@ -35,3 +35,20 @@ class Test_TLS_ASSET(unittest.TestCase):
         with self.assertRaises(ValueError):
             asset_data = RvnAssetData(
                 b'tlsx\rNUKA/COLA/CAP\x00\xe9\n\xb5\xe2\x00\x00\x00')
+
+    def test_parse_many(self):
+        buffers = [b'tlst\rNUKA/COLA/CAP\x00\xe9\n\xb5\xe2\x00\x00\x00',
+                   '72766e7404234c544300e1f50500000000',
+                   '14d4a4a095e02cd6a9b3cf15cf16cc42dc63baf3e006042342544301',
+                   b'tlso\x05ADMIN']
+        types, names, amounts = RvnAssetData.parse_many(buffers)
+        for i, buf in enumerate(buffers):
+            asset_data = RvnAssetData(buf)
+            self.assertEqual(types[i], asset_data.asset_type)
+            self.assertEqual(names[i], asset_data.asset_name)
+            self.assertEqual(amounts[i], asset_data.amount)
+        self.assertEqual(names[0], "NUKA/COLA/CAP")
+        self.assertEqual(types[3], "admin")
+
+        with self.assertRaises(ValueError):
+            RvnAssetData.parse_many([b'tlsx\rNUKA/COLA/CAP\x00\xe9\n\xb5\xe2\x00\x00\x00'])
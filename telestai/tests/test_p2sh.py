@@ -3,7 +3,9 @@ from telestai.core.key import CPubKey, CECKey
 import os
 import hashlib
 
-from telestai.core.script import OP_CHECKMULTISIG, CScript, CreateMultisigRedeemScript
+from telestai.core import COutPoint, CMutableTxIn, CMutableTxOut
+from telestai.core.script import OP_CHECKMULTISIG, SIGHASH_ALL, CScript, CreateMultisigRedeemScript
+from telestai.core.scripteval import VerifyScript
 from telestai.crypto import verify_multisig_script, verify_signature
 from telestai.wallet import P2PKHTelestaiAddress, P2SHTelestaiAddress, CTelestaiSecret
 from telestai.core.transaction import CMultiSigTransaction
@@ -120,6 +122,22 @@ class TestP2SHFunctions(unittest.TestCase):
             print(f"An error occurred: {e}")
             raise
 
+    def test_sign_with_multiple_keys(self):
+        redeem_script = CreateMultisigRedeemScript(2, self.public_keys)
+        tx = CMultiSigTransaction([CMutableTxIn(COutPoint(b'\x01' * 32, 0))],
+                                  [CMutableTxOut(1, CScript())])
+
+        signatures = tx.sign_with_multiple_keys(self.private_keys, redeem_script, 2)
+        self.assertEqual(len(signatures), 2)
+        self.assertTrue(all(sig[-1] == SIGHASH_ALL for sig in signatures))
+
+        tx.apply_multisig_signatures([signatures], redeem_script)
+        VerifyScript(tx.vin[0].scriptSig, redeem_script.to_p2sh_scriptPubKey(),
+                     tx, 0, flags=set())
+
+        with self.assertRaises(ValueError):
+            tx.sign_with_multiple_keys(self.private_keys[:1], redeem_script, 2)
+
     # def test_spend_p2sh_address(self):
     #     # Create a redeem script
     #     redeem_script = CreateMultisigRedeemScript(2, self.public_keys)
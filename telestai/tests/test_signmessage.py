@@ -11,22 +11,18 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import functools
 import unittest
 
-from telestai.wallet import CTelestaiSecret
-from telestai.signmessage import TelestaiMessage, VerifyMessage, SignMessage
-import sys
+from telestai.core.serialize import Hash
+from telestai.wallet import CTelestaiSecret, P2PKHTelestaiAddress
+from telestai.signmessage import TelestaiMessage, VerifyMessage, VerifyMessages, SignMessage, SignAndVerifyMessage
 import os
 import json
 
-_bchr = chr
-_bord = ord
-if sys.version > '3':
-    long = int
-    def _bchr(x): return bytes([x])
-    def _bord(x): return x
-
 
+# Several tests use the same vectors; parse each file only once
+@functools.lru_cache(maxsize=4)
 def load_test_vectors(name):
     with open(os.path.dirname(__file__) + '/data/' + name, 'r') as fd:
         return json.load(fd)
@@ -48,6 +44,40 @@ class Test_SignVerifyMessage(unittest.TestCase):
             self.assertTrue(VerifyMessage(
                 vector['address'], message, vector['signature']))
 
+    def test_message_hash_cached(self):
+        message = TelestaiMessage("RE34JR9zKhCLu4R7JFaDJz8JnypJDmCE14")
+        h = message.GetHash()
+        self.assertIs(message.GetHash(), h)
+        self.assertEqual(h, Hash(message.serialize()))
+
+        for n in (0, 0xfc, 0xfd, 0x10000):
+            message = TelestaiMessage('x' * n)
+            self.assertEqual(message.GetHash(), Hash(message.serialize()))
+
+    def test_message_bytes(self):
+        message = TelestaiMessage("RE34JR9zKhCLu4R7JFaDJz8JnypJDmCE14")
+        self.assertEqual(message.magic, b"Telestai Signed Message:\n")
+        self.assertEqual(TelestaiMessage(b"RE34JR9zKhCLu4R7JFaDJz8JnypJDmCE14"), message)
+        self.assertEqual(TelestaiMessage("RE34JR9zKhCLu4R7JFaDJz8JnypJDmCE14",
+                                         "Telestai Signed Message:\n"), message)
+        self.assertEqual(TelestaiMessage.deserialize(message.serialize()), message)
+
+    def test_verify_messages(self):
+        key = CTelestaiSecret(
+            "L1gVQSmAJDnkK1A1V3mJehL9xQbdai9CCx65d29seRFGVVheyngq")
+        address = str(P2PKHTelestaiAddress.from_pubkey(key.pub))
+        items = []
+        for i in range(8):
+            message = TelestaiMessage('message %d' % i)
+            items.append((address, message, SignMessage(key, message)))
+        # A signature over a different message
+        items.append((address, TelestaiMessage('other'), items[0][2]))
+
+        expected = [True] * 8 + [False]
+        self.assertEqual(VerifyMessages(items, max_workers=4), expected)
+        self.assertEqual(VerifyMessages(items, max_workers=1), expected)
+        self.assertEqual(VerifyMessages([]), [])
+
     def test_sign_message_simple(self):
         key = CTelestaiSecret(
             "L1gVQSmAJDnkK1A1V3mJehL9xQbdai9CCx65d29seRFGVVheyngq")
@@ -60,6 +90,15 @@ class Test_SignVerifyMessage(unittest.TestCase):
         self.assertTrue(signature)
         self.assertTrue(VerifyMessage(address, message, signature))
 
+    def test_sign_and_verify_message(self):
+        key = CTelestaiSecret(
+            "L1gVQSmAJDnkK1A1V3mJehL9xQbdai9CCx65d29seRFGVVheyngq")
+        address = str(P2PKHTelestaiAddress.from_pubkey(key.pub))
+        message = TelestaiMessage(address)
+
+        signature = SignAndVerifyMessage(key, message)
+        self.assertTrue(VerifyMessage(address, message, signature))
+
     def test_sign_message_vectors(self):
         for vector in load_test_vectors('signmessage.json'):
             key = CTelestaiSecret(vector['wif'])
@@ -14,6 +14,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import hashlib
 import unittest
 
+import telestai
 from telestai.core import b2x, x
 from telestai.core.script import CScript, IsLowDERSignature
 from telestai.core.key import CPubKey, is_libsec256k1_available, use_libsecp256k1_for_signing
@@ -49,6 +50,26 @@ class Test_CTelestaiAddress(unittest.TestCase):
 #          x('c7a1f1a4d6b4c1802a59631966a18359de779e8a6a65973735a3ccdfdabc407d'), 0,
 #          P2WSHTelestaiAddress)
 
+    def test_create_from_bech32_string(self):
+        """Create CTelestaiAddress's from bech32 strings"""
+        addr = P2WPKHTelestaiAddress.from_bytes(0, b'\x01' * 20)
+        for s in (str(addr), str(addr).upper()):
+            self.assertEqual(CTelestaiAddress(s), addr)
+            self.assertEqual(CTelestaiAddress(s).__class__, P2WPKHTelestaiAddress)
+
+        with self.assertRaises(CTelestaiAddressError):
+            CTelestaiAddress('ev1qqqq')
+
+    def test_select_params(self):
+        """Address versions follow SelectParams()"""
+        try:
+            telestai.SelectParams('testnet')
+            self.assertEqual(P2PKHTelestaiAddress.from_bytes(b'\x00' * 20).nVersion, 111)
+            self.assertEqual(P2SHTelestaiAddress.from_bytes(b'\x00' * 20).nVersion, 196)
+        finally:
+            telestai.SelectParams('mainnet')
+        self.assertEqual(P2PKHTelestaiAddress.from_bytes(b'\x00' * 20).nVersion, 66)
+
     def test_wrong_nVersion(self):
         """Creating a CTelestaiAddress from a unknown nVersion fails"""
 
@@ -156,6 +177,17 @@ class Test_CTelestaiAddress(unittest.TestCase):
         T('R9HC5WtHbpoa51NCUAz86XLCmGTbkf45NT',
           '76a914000000000000000000000000000000000000000088ac')
 
+    def test_to_scriptPubKey_cached(self):
+        """to_scriptPubKey() builds the script once per address"""
+        for addr, expected in ((P2SHTelestaiAddress.from_bytes(b'\x00' * 20),
+                                'a914000000000000000000000000000000000000000087'),
+                               (P2PKHTelestaiAddress.from_bytes(b'\x00' * 20),
+                                '76a914000000000000000000000000000000000000000088ac'),
+                               (P2WPKHTelestaiAddress.from_bytes(0, b'\x00' * 20),
+                                '00140000000000000000000000000000000000000000')):
+            self.assertEqual(b2x(addr.to_scriptPubKey()), expected)
+            self.assertIs(addr.to_scriptPubKey(), addr.to_scriptPubKey())
+
 
 class Test_P2SHTelestaiAddress(unittest.TestCase):
     def test_from_redeemScript(self):
@@ -167,6 +199,12 @@ class Test_P2SHTelestaiAddress(unittest.TestCase):
         T(CScript(x('76a914751e76e8199196d454941c45d1b3a323f1433bd688ac')),
           'rQy5KSWuzWQwK6ZGJ8wkwLGDb5oCh5FXog')
 
+    def test_to_scripthash(self):
+        addr = P2SHTelestaiAddress.from_bytes(x('751e76e8199196d454941c45d1b3a323f1433bd6'))
+        expected = hashlib.sha256(addr.to_scriptPubKey()).digest()[::-1].hex()
+        self.assertEqual(addr.to_scripthash(), expected)
+        self.assertEqual(addr.to_scripthash(), expected)
+
 
 class Test_P2PKHTelestaiAddress(unittest.TestCase):
     def test_from_non_canonical_scriptPubKey(self):
@@ -219,6 +257,28 @@ class Test_P2PKHTelestaiAddress(unittest.TestCase):
             P2PKHTelestaiAddress.from_scriptPubKey(
                 x('2200000000000000000000000000000000000000000000000000000000000000000000ac'))
 
+    def test_from_scriptPubKey_forms(self):
+        """Canonical and non-canonical forms give the same hash"""
+        h = x('751e76e8199196d454941c45d1b3a323f1433bd6')
+        for hex_scriptPubKey in ('76a914751e76e8199196d454941c45d1b3a323f1433bd688ac',
+                                 '76a94c14751e76e8199196d454941c45d1b3a323f1433bd688ac',
+                                 '0014751e76e8199196d454941c45d1b3a323f1433bd6',
+                                 '160014751e76e8199196d454941c45d1b3a323f1433bd6'):
+            addr = P2PKHTelestaiAddress.from_scriptPubKey(CScript(x(hex_scriptPubKey)))
+            self.assertEqual(addr.to_bytes(), h)
+
+        pubkey = x('0378d430274f8c5ec1321338151e9f27f4c676a008bdf8638d07c0b6be9ab35c71')
+        for scriptPubKey in (CScript(x('21') + pubkey + x('ac')),
+                             CScript(x('4c21') + pubkey + x('ac'))):
+            addr = P2PKHTelestaiAddress.from_scriptPubKey(scriptPubKey)
+            self.assertEqual(addr, P2PKHTelestaiAddress.from_pubkey(pubkey))
+
+        with self.assertRaises(CTelestaiAddressError):
+            P2PKHTelestaiAddress.from_scriptPubKey(CScript(x('4c21') + pubkey + x('ac')),
+                                                  accept_non_canonical_pushdata=False)
+        with self.assertRaises(CTelestaiAddressError):
+            P2PKHTelestaiAddress.from_scriptPubKey(CScript(x('4c')))
+
     def test_from_valid_pubkey(self):
         """Create P2PKHTelestaiAddress's from valid pubkeys"""
 
@@ -260,6 +320,27 @@ class Test_P2PKHTelestaiAddress(unittest.TestCase):
             P2PKHTelestaiAddress.from_pubkey(CPubKey(
                 x('0378d430274f8c5ec1321338151e9f27f4c676a008bdf8638d07c0b6be9ab35c72')))
 
+    def test_from_pubkeys(self):
+        """Create many P2PKHTelestaiAddress's at once"""
+        pubkeys = [x('03d9e529a03f92beba94c85dd869f94388c19c6d7b7c055b3202fee0f70fbfd835'),
+                   CPubKey(x('029ef231f0606dc7b9b4c7af16d0f4a9645b62564f6f167d1f053964b7efff6466'))]
+        invalid = x('0378d430274f8c5ec1321338151e9f27f4c676a008bdf8638d07c0b6be9ab35c72')
+
+        addrs = P2PKHTelestaiAddress.from_pubkeys(pubkeys)
+        self.assertEqual([str(addr) for addr in addrs],
+                         [str(P2PKHTelestaiAddress.from_pubkey(pubkey)) for pubkey in pubkeys])
+        self.assertEqual([addr.__class__ for addr in addrs], [P2PKHTelestaiAddress] * 2)
+
+        self.assertEqual(P2PKHTelestaiAddress.from_pubkeys([invalid], accept_invalid=True),
+                         [P2PKHTelestaiAddress.from_pubkey(invalid, accept_invalid=True)])
+        with self.assertRaises(CTelestaiAddressError):
+            P2PKHTelestaiAddress.from_pubkeys(pubkeys + [invalid])
+
+        class SubAddress(P2PKHTelestaiAddress):
+            pass
+        self.assertEqual([addr.__class__ for addr in SubAddress.from_pubkeys(pubkeys)],
+                         [SubAddress] * 2)
+
 
 class Test_CTelestaiSecret(unittest.TestCase):
     def test(self):
@@ -267,6 +348,7 @@ class Test_CTelestaiSecret(unittest.TestCase):
             key = CTelestaiSecret(base58_privkey)
             self.assertEqual(b2x(key.pub), expected_hex_pubkey)
             self.assertEqual(key.is_compressed, expected_is_compressed_value)
+            self.assertEqual(key.to_wif(), base58_privkey)
 
         T('5KJvsngHeMpm884wtkJNzQGaCErckhHJBGFsvd3VyK5qMZXj3hS',
           '0478d430274f8c5ec1321338151e9f27f4c676a008bdf8638d07c0b6be9ab35c71a1518063243acd4dfe96b66e3f2ec8013c8e072cd09b3834a19f81f659cc3455',
@@ -275,6 +357,15 @@ class Test_CTelestaiSecret(unittest.TestCase):
           '0378d430274f8c5ec1321338151e9f27f4c676a008bdf8638d07c0b6be9ab35c71',
           True)
 
+    def test_to_wif_many(self):
+        secrets = [hashlib.sha256(bytes([i])).digest() for i in range(3)]
+        for compressed in (True, False):
+            self.assertEqual(CTelestaiSecret.to_wif_many(secrets, compressed),
+                             [CTelestaiSecret.from_secret_bytes(secret, compressed).to_wif()
+                              for secret in secrets])
+        with self.assertRaises(ValueError):
+            CTelestaiSecret.to_wif_many([b'\x01' * 31])
+
     def test_sign(self):
         key = CTelestaiSecret(
             '5KJvsngHeMpm884wtkJNzQGaCErckhHJBGFsvd3VyK5qMZXj3hS')
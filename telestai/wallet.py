@@ -16,6 +16,7 @@ scriptPubKeys; currently there is no actual wallet support implemented.
 """
 
 from __future__ import absolute_import, division, print_function, unicode_literals
+import functools
 import hashlib
 import telestai.core.script as script
 import telestai.core.key
@@ -24,28 +25,64 @@ import telestai.bech32
 import telestai.base58
 import telestai
 
-import array
-import sys
-
 from telestai.core.serialize import Hash160
-from telestai.blockchain.utils import double_sha256
 
-_bord = ord
-def _tobytes(x): return array.array('B', x).tostring()
+_sha256 = hashlib.sha256
+
+
+def _set_address_prefixes(params):
+    # Cached address/secret version bytes and bech32 prefix of the selected
+    # chain; _BECH32_PREFIX is None if the chain has no bech32 addresses.
+    global _SCRIPT_ADDR, _PUBKEY_ADDR, _SECRET_KEY, _BECH32_PREFIX
+    global _BASE58_VERSION_CLASSES
+    _SCRIPT_ADDR = params.BASE58_PREFIXES['SCRIPT_ADDR']
+    _PUBKEY_ADDR = params.BASE58_PREFIXES['PUBKEY_ADDR']
+    _SECRET_KEY = params.BASE58_PREFIXES['SECRET_KEY']
+    _BECH32_PREFIX = params.BECH32_HRP + '1' if params.BECH32_HRP else None
+    _BASE58_VERSION_CLASSES = {_SCRIPT_ADDR: P2SHTelestaiAddress,
+                               _PUBKEY_ADDR: P2PKHTelestaiAddress}
+
+
+# Fixed bytes of the scriptPubKey forms P2PKHTelestaiAddress recognizes
+_P2PKH_PREFIX = bytes([script.OP_DUP, script.OP_HASH160, 0x14])
+_P2PKH_SUFFIX = bytes([script.OP_EQUALVERIFY, script.OP_CHECKSIG])
+_COMPRESSED_PREFIX = b'\x21'
+_UNCOMPRESSED_PREFIX = b'\x41'
+_CHECKSIG = bytes([script.OP_CHECKSIG])
+
+_P2SH_PREFIX = bytes([script.OP_HASH160, 0x14])
+_P2SH_SUFFIX = bytes([script.OP_EQUAL])
+
+# Opcodes preceding the pushed hash/program in the scriptPubKeys built by
+# to_scriptPubKey(); concatenating bytes is much cheaper than CScript([...])
+_OP_0 = bytes([script.OP_0])
+_OP_HASH160 = bytes([script.OP_HASH160])
+_OP_DUP_HASH160 = bytes([script.OP_DUP, script.OP_HASH160])
+_pushdata = script.CScriptOp.encode_op_pushdata
 
 
-if sys.version > '3':
-    def _bord(x): return x
-    _tobytes = bytes
+@functools.lru_cache(maxsize=4096)
+def _p2sh_scripthash(script_hash):
+    # ElectrumX scripthash of the P2SH scriptPubKey paying to script_hash;
+    # cached as the same addresses tend to be looked up over and over.
+    digest = _sha256(_P2SH_PREFIX + script_hash + _P2SH_SUFFIX).digest()
+    return digest[::-1].hex()
+
+
+# Suffix of a secret key whose pubkey is compressed
+_COMPRESSED_TAG = b'\x01'
 
 
 class CTelestaiAddress(object):
 
     def __new__(cls, s):
-        #        try:
-        #            return CBech32TelestaiAddress(s)
-        #        except telestai.bech32.Bech32Error:
-        #            pass
+        # Only strings carrying the chain's bech32 prefix are tried as bech32;
+        # everything else goes straight to base58.
+        if _BECH32_PREFIX is not None and s[:len(_BECH32_PREFIX)].lower() == _BECH32_PREFIX:
+            try:
+                return CBech32TelestaiAddress(s)
+            except telestai.bech32.Bech32Error:
+                pass
 
         try:
             return CBase58TelestaiAddress(s)
@@ -58,13 +95,14 @@ class CTelestaiAddress(object):
     @classmethod
     def from_scriptPubKey(cls, scriptPubKey):
         """Convert a scriptPubKey to a subclass of CTelestaiAddress"""
-#        try:
-#            return CBech32TelestaiAddress.from_scriptPubKey(scriptPubKey)
-#        except CTelestaiAddressError:
-#            pass
+        # Witness v0 keyhash scripts are deliberately left to the P2PKH
+        # parser, which maps them to P2PKH addresses, rather than to
+        # CBech32TelestaiAddress.
+        if scriptPubKey.is_p2sh():
+            return P2SHTelestaiAddress.from_bytes(scriptPubKey[2:22], _SCRIPT_ADDR)
 
         try:
-            return CBase58TelestaiAddress.from_scriptPubKey(scriptPubKey)
+            return P2PKHTelestaiAddress.from_scriptPubKey(scriptPubKey)
         except CTelestaiAddressError:
             pass
 
@@ -85,17 +123,15 @@ class CBech32TelestaiAddress(telestai.bech32.CBech32Data, CTelestaiAddress):
         assert witver == 0
         self = super(CBech32TelestaiAddress, cls).from_bytes(
             witver,
-            _tobytes(witprog)
+            bytes(witprog)
         )
 
-        if len(self) == 32:
-            self.__class__ = P2WSHTelestaiAddress
-        elif len(self) == 20:
-            self.__class__ = P2WPKHTelestaiAddress
-        else:
+        addr_class = _WITNESS_PROGRAM_CLASSES.get(len(self))
+        if addr_class is None:
             raise CTelestaiAddressError(
                 'witness program does not match any known segwit address format')
 
+        self.__class__ = addr_class
         return self
 
     @classmethod
@@ -106,15 +142,11 @@ class CBech32TelestaiAddress(telestai.bech32.CBech32Data, CTelestaiAddress):
         P2WPKHTelestaiAddress. If the scriptPubKey is not recognized
         CTelestaiAddressError will be raised.
         """
-        try:
-            return P2WSHTelestaiAddress.from_scriptPubKey(scriptPubKey)
-        except CTelestaiAddressError:
-            pass
+        if scriptPubKey.is_witness_v0_scripthash():
+            return P2WSHTelestaiAddress.from_bytes(0, scriptPubKey[2:34])
 
-        try:
-            return P2WPKHTelestaiAddress.from_scriptPubKey(scriptPubKey)
-        except CTelestaiAddressError:
-            pass
+        elif scriptPubKey.is_witness_v0_keyhash():
+            return P2WPKHTelestaiAddress.from_bytes(0, scriptPubKey[2:22])
 
         raise CTelestaiAddressError(
             'scriptPubKey not a valid bech32-encoded address')
@@ -127,16 +159,12 @@ class CBase58TelestaiAddress(telestai.base58.CBase58Data, CTelestaiAddress):
     def from_bytes(cls, data, nVersion):
         self = super(CBase58TelestaiAddress, cls).from_bytes(data, nVersion)
 
-        if nVersion == telestai.params.BASE58_PREFIXES['SCRIPT_ADDR']:
-            self.__class__ = P2SHTelestaiAddress
-
-        elif nVersion == telestai.params.BASE58_PREFIXES['PUBKEY_ADDR']:
-            self.__class__ = P2PKHTelestaiAddress
-
-        else:
+        addr_class = _BASE58_VERSION_CLASSES.get(nVersion)
+        if addr_class is None:
             raise CTelestaiAddressError(
                 'Version %d not a recognized Telestai Address' % nVersion)
 
+        self.__class__ = addr_class
         return self
 
     @classmethod
@@ -147,10 +175,10 @@ class CBase58TelestaiAddress(telestai.base58.CBase58Data, CTelestaiAddress):
         P2PKHTelestaiAddress. If the scriptPubKey is not recognized
         CTelestaiAddressError will be raised.
         """
-        try:
-            return P2SHTelestaiAddress.from_scriptPubKey(scriptPubKey)
-        except CTelestaiAddressError:
-            pass
+        # Pick P2SH by its fixed form up front rather than by trying it and
+        # catching the error, as most scriptPubKeys are P2PKH.
+        if scriptPubKey.is_p2sh():
+            return P2SHTelestaiAddress.from_bytes(scriptPubKey[2:22], _SCRIPT_ADDR)
 
         try:
             return P2PKHTelestaiAddress.from_scriptPubKey(scriptPubKey)
@@ -165,13 +193,15 @@ class P2SHTelestaiAddress(CBase58TelestaiAddress):
     @classmethod
     def from_bytes(cls, data, nVersion=None):
         if nVersion is None:
-            nVersion = telestai.params.BASE58_PREFIXES['SCRIPT_ADDR']
+            nVersion = _SCRIPT_ADDR
 
-        elif nVersion != telestai.params.BASE58_PREFIXES['SCRIPT_ADDR']:
+        elif nVersion != _SCRIPT_ADDR:
             raise ValueError('nVersion incorrect for P2SH address: got %d; expected %d' %
-                             (nVersion, telestai.params.BASE58_PREFIXES['SCRIPT_ADDR']))
+                             (nVersion, _SCRIPT_ADDR))
 
-        return super(P2SHTelestaiAddress, cls).from_bytes(data, nVersion)
+        # nVersion is already known to be ours, so skip the version to class
+        # dispatch of CBase58TelestaiAddress.from_bytes()
+        return super(CBase58TelestaiAddress, cls).from_bytes(data, nVersion)
 
     @classmethod
     def from_redeemScript(cls, redeemScript):
@@ -189,37 +219,41 @@ class P2SHTelestaiAddress(CBase58TelestaiAddress):
         form.
         """
         if scriptPubKey.is_p2sh():
-            return cls.from_bytes(scriptPubKey[2:22], telestai.params.BASE58_PREFIXES['SCRIPT_ADDR'])
+            return cls.from_bytes(scriptPubKey[2:22], _SCRIPT_ADDR)
 
         else:
             raise CTelestaiAddressError('not a P2SH scriptPubKey')
 
     def to_scriptPubKey(self):
         """Convert an address to a scriptPubKey"""
-        assert self.nVersion == telestai.params.BASE58_PREFIXES['SCRIPT_ADDR']
-        return script.CScript([script.OP_HASH160, self, script.OP_EQUAL])
+        try:
+            return self._cached_scriptPubKey
+        except AttributeError:
+            assert self.nVersion == _SCRIPT_ADDR
+            self._cached_scriptPubKey = script.CScript(_OP_HASH160 + _pushdata(self) + _P2SH_SUFFIX)
+            return self._cached_scriptPubKey
 
     def to_redeemScript(self):
         return self.to_scriptPubKey()
     
     def to_scripthash(self):
         """Convert address to a scripthash for ElectrumX compatibility"""
-        script_pubkey = self.to_scriptPubKey()
-        scripthash = hashlib.sha256(script_pubkey).digest()
-        return scripthash[::-1].hex()
+        return _p2sh_scripthash(bytes(self))
 
 
 class P2PKHTelestaiAddress(CBase58TelestaiAddress):
     @classmethod
     def from_bytes(cls, data, nVersion=None):
         if nVersion is None:
-            nVersion = telestai.params.BASE58_PREFIXES['PUBKEY_ADDR']
+            nVersion = _PUBKEY_ADDR
 
-        elif nVersion != telestai.params.BASE58_PREFIXES['PUBKEY_ADDR']:
+        elif nVersion != _PUBKEY_ADDR:
             raise ValueError('nVersion incorrect for P2PKH address: got %d; expected %d' %
-                                (nVersion, telestai.params.BASE58_PREFIXES['PUBKEY_ADDR']))
+                                (nVersion, _PUBKEY_ADDR))
 
-        return super(P2PKHTelestaiAddress, cls).from_bytes(data, nVersion)
+        # nVersion is already known to be ours, so skip the version to class
+        # dispatch of CBase58TelestaiAddress.from_bytes()
+        return super(CBase58TelestaiAddress, cls).from_bytes(data, nVersion)
 
     @classmethod
     def from_pubkey(cls, pubkey, accept_invalid=False):
@@ -243,6 +277,37 @@ class P2PKHTelestaiAddress(CBase58TelestaiAddress):
         pubkey_hash = telestai.core.Hash160(pubkey)
         return P2PKHTelestaiAddress.from_bytes(pubkey_hash)
 
+    @classmethod
+    def from_pubkeys(cls, pubkeys, accept_invalid=False):
+        """Create P2PKH telestai addresses from many pubkeys
+
+        Returns the same list as calling from_pubkey() on each pubkey, but
+        with the per-call lookups and checks hoisted out of the loop, for bulk
+        derivation.
+        """
+        CPubKey = telestai.core.key.CPubKey
+        new_hash = hashlib.new
+        sha256 = _sha256
+        # Skips the version dispatch of from_bytes(), as from_bytes() does
+        from_bytes = super(CBase58TelestaiAddress, cls).from_bytes
+        nVersion = _PUBKEY_ADDR
+
+        addrs = []
+        for pubkey in pubkeys:
+            if not isinstance(pubkey, bytes):
+                raise TypeError(
+                    'pubkey must be bytes instance; got %r' % pubkey.__class__)
+
+            if not accept_invalid:
+                if not isinstance(pubkey, CPubKey):
+                    pubkey = CPubKey(pubkey)
+                if not pubkey.is_fullyvalid:
+                    raise CTelestaiAddressError('invalid pubkey')
+
+            addrs.append(from_bytes(
+                new_hash('ripemd160', sha256(pubkey).digest()).digest(), nVersion))
+        return addrs
+
     @classmethod
     def from_scriptPubKey(cls, scriptPubKey, accept_non_canonical_pushdata=True, accept_bare_checksig=True):
         """Convert a scriptPubKey to a P2PKH address
@@ -254,56 +319,73 @@ class P2PKHTelestaiAddress(CBase58TelestaiAddress):
 
         accept_bare_checksig          - Treat bare-checksig as P2PKH scriptPubKeys (default True)
         """
-        if accept_non_canonical_pushdata:
-            # Canonicalize script pushes
-            # in case it's not a CScript instance yet
+        if (len(scriptPubKey) == 25
+                and scriptPubKey.startswith(_P2PKH_PREFIX)
+                and scriptPubKey.endswith(_P2PKH_SUFFIX)):
+            # The usual case, checked inline
+            return cls.from_bytes(scriptPubKey[3:23], _PUBKEY_ADDR)
+
+        if not isinstance(scriptPubKey, script.CScript):
             scriptPubKey = script.CScript(scriptPubKey)
 
+        # Recognized forms are canonical already, so only scripts that don't
+        # match as they are need their pushes canonicalized and another look.
+        addr = cls._from_canonical_scriptPubKey(scriptPubKey, accept_bare_checksig)
+        if addr is None and accept_non_canonical_pushdata:
             try:
-                scriptPubKey = script.CScript(
-                    tuple(scriptPubKey))  # canonicalize
+                canonical = script.CScript(tuple(scriptPubKey))
             except telestai.core.script.CScriptInvalidError:
                 raise CTelestaiAddressError(
                     'not a P2PKH scriptPubKey: script is invalid')
 
-        if scriptPubKey.is_witness_v0_keyhash():
-            return cls.from_bytes(scriptPubKey[2:22], telestai.params.BASE58_PREFIXES['PUBKEY_ADDR'])
+            if canonical != scriptPubKey:
+                addr = cls._from_canonical_scriptPubKey(canonical, accept_bare_checksig)
+
+        if addr is None:
+            raise CTelestaiAddressError('not a P2PKH scriptPubKey')
+        return addr
+
+    @classmethod
+    def _from_canonical_scriptPubKey(cls, scriptPubKey, accept_bare_checksig):
+        # The address for a scriptPubKey in one of the recognized forms,
+        # compared byte for byte; None if it isn't one.
+        if (len(scriptPubKey) == 25
+                and scriptPubKey.startswith(_P2PKH_PREFIX)
+                and scriptPubKey.endswith(_P2PKH_SUFFIX)):
+            return cls.from_bytes(scriptPubKey[3:23], _PUBKEY_ADDR)
+        elif scriptPubKey.is_witness_v0_keyhash():
+            return cls.from_bytes(scriptPubKey[2:22], _PUBKEY_ADDR)
         elif scriptPubKey.is_witness_v0_nested_keyhash():
-            return cls.from_bytes(scriptPubKey[3:23], telestai.params.BASE58_PREFIXES['PUBKEY_ADDR'])
-        elif (len(scriptPubKey) == 25
-                and _bord(scriptPubKey[0]) == script.OP_DUP
-                and _bord(scriptPubKey[1]) == script.OP_HASH160
-                and _bord(scriptPubKey[2]) == 0x14
-                and _bord(scriptPubKey[23]) == script.OP_EQUALVERIFY
-                and _bord(scriptPubKey[24]) == script.OP_CHECKSIG):
-            return cls.from_bytes(scriptPubKey[3:23], telestai.params.BASE58_PREFIXES['PUBKEY_ADDR'])
+            return cls.from_bytes(scriptPubKey[3:23], _PUBKEY_ADDR)
 
         elif accept_bare_checksig:
             pubkey = None
 
-            # We can operate on the raw bytes directly because we've
-            # canonicalized everything above.
             if (len(scriptPubKey) == 35  # compressed
-                and _bord(scriptPubKey[0]) == 0x21
-                    and _bord(scriptPubKey[34]) == script.OP_CHECKSIG):
+                    and scriptPubKey.startswith(_COMPRESSED_PREFIX)
+                    and scriptPubKey.endswith(_CHECKSIG)):
 
                 pubkey = scriptPubKey[1:34]
 
             elif (len(scriptPubKey) == 67  # uncompressed
-                    and _bord(scriptPubKey[0]) == 0x41
-                    and _bord(scriptPubKey[66]) == script.OP_CHECKSIG):
+                    and scriptPubKey.startswith(_UNCOMPRESSED_PREFIX)
+                    and scriptPubKey.endswith(_CHECKSIG)):
 
                 pubkey = scriptPubKey[1:65]
 
             if pubkey is not None:
                 return cls.from_pubkey(pubkey, accept_invalid=True)
 
-        raise CTelestaiAddressError('not a P2PKH scriptPubKey')
+        return None
 
     def to_scriptPubKey(self, nested=False):
         """Convert an address to a scriptPubKey"""
-        assert self.nVersion == telestai.params.BASE58_PREFIXES['PUBKEY_ADDR']
-        return script.CScript([script.OP_DUP, script.OP_HASH160, self, script.OP_EQUALVERIFY, script.OP_CHECKSIG])
+        try:
+            return self._cached_scriptPubKey
+        except AttributeError:
+            assert self.nVersion == _PUBKEY_ADDR
+            self._cached_scriptPubKey = script.CScript(_OP_DUP_HASH160 + _pushdata(self) + _P2PKH_SUFFIX)
+            return self._cached_scriptPubKey
 
     def to_redeemScript(self):
         return self.to_scriptPubKey()
@@ -325,8 +407,12 @@ class P2WSHTelestaiAddress(CBech32TelestaiAddress):
 
     def to_scriptPubKey(self):
         """Convert an address to a scriptPubKey"""
-        assert self.witver == 0
-        return script.CScript([0, self])
+        try:
+            return self._cached_scriptPubKey
+        except AttributeError:
+            assert self.witver == 0
+            self._cached_scriptPubKey = script.CScript(_OP_0 + _pushdata(self))
+            return self._cached_scriptPubKey
 
     def to_redeemScript(self):
         return NotImplementedError("not enough data in p2wsh address to reconstruct redeem script")
@@ -348,11 +434,24 @@ class P2WPKHTelestaiAddress(CBech32TelestaiAddress):
 
     def to_scriptPubKey(self):
         """Convert an address to a scriptPubKey"""
-        assert self.witver == 0
-        return script.CScript([0, self])
+        try:
+            return self._cached_scriptPubKey
+        except AttributeError:
+            assert self.witver == 0
+            self._cached_scriptPubKey = script.CScript(_OP_0 + _pushdata(self))
+            return self._cached_scriptPubKey
 
     def to_redeemScript(self):
-        return script.CScript([script.OP_DUP, script.OP_HASH160, self, script.OP_EQUALVERIFY, script.OP_CHECKSIG])
+        return script.CScript(_OP_DUP_HASH160 + _pushdata(self) + _P2PKH_SUFFIX)
+
+
+# Address class by witness program length
+_WITNESS_PROGRAM_CLASSES = {20: P2WPKHTelestaiAddress,
+                            32: P2WSHTelestaiAddress}
+
+# Registered once the address classes exist, as the hook also maps the
+# chain's version bytes to them.
+telestai._add_params_hook(_set_address_prefixes)
 
 
 class CKey(object):
@@ -367,16 +466,35 @@ class CKey(object):
     """
 
     def __init__(self, secret, compressed=True):
-        self._cec_key = telestai.core.key.CECKey()
-        self._cec_key.set_secretbytes(secret)
-        self._cec_key.set_compressed(compressed)
+        # Deriving the public key is an EC point multiplication, by far the
+        # most expensive part of a key, so it's put off until pub or a
+        # signature is first needed.
+        self._secret = bytes(secret)
+        self._compressed = bool(compressed)
 
-        self.pub = telestai.core.key.CPubKey(
-            self._cec_key.get_pubkey(), self._cec_key)
+    @property
+    def _cec_key(self):
+        try:
+            return self._cached_cec_key
+        except AttributeError:
+            cec_key = telestai.core.key.CECKey()
+            cec_key.set_secretbytes(self._secret)
+            cec_key.set_compressed(self._compressed)
+            self._cached_cec_key = cec_key
+            return cec_key
+
+    @property
+    def pub(self):
+        try:
+            return self._cached_pub
+        except AttributeError:
+            cec_key = self._cec_key
+            self._cached_pub = telestai.core.key.CPubKey(cec_key.get_pubkey(), cec_key)
+            return self._cached_pub
 
     @property
     def is_compressed(self):
-        return self.pub.is_compressed
+        return self._compressed
 
     def sign(self, hash):
         return self._cec_key.sign(hash)
@@ -395,37 +513,53 @@ class CTelestaiSecret(telestai.base58.CBase58Data, CKey):
     @classmethod
     def from_secret_bytes(cls, secret, compressed=True):
         """Create a secret key from a 32-byte secret"""
-        self = cls.from_bytes(secret + (b'\x01' if compressed else b''),
-                              telestai.params.BASE58_PREFIXES['SECRET_KEY'])
+        self = cls.from_bytes(bytes(secret) + (_COMPRESSED_TAG if compressed else b''),
+                              _SECRET_KEY)
         self.__init__(None)
         return self
 
     def __init__(self, s):
-        if self.nVersion != telestai.params.BASE58_PREFIXES['SECRET_KEY']:
+        if self.nVersion != _SECRET_KEY:
             raise CTelestaiSecretError('Not a base58-encoded secret key: got nVersion=%d; expected nVersion=%d' %
-                                      (self.nVersion, telestai.params.BASE58_PREFIXES['SECRET_KEY']))
+                                      (self.nVersion, _SECRET_KEY))
 
         CKey.__init__(self, self[0:32], len(self) >
-                      32 and _bord(self[32]) == 1)
+                      32 and self[32] == 1)
         
     def to_wif(self) -> str:
         """Convert this secret key to a WIF (Wallet Import Format) string."""
-        payload = self[:]  # Get the internal byte representation of the secret key
-        if self.is_compressed:
-            payload += b'\x01'  # Add compression flag if the key is compressed
-
-        version_byte = telestai.params.BASE58_PREFIXES['SECRET_KEY']
-        payload = bytes([version_byte]) + payload
+        # The secret bytes already end in the compression flag if the key is
+        # compressed, so this is just the version byte plus self.
+        payload = bytes((_SECRET_KEY,)) + self
 
         # Calculate checksum (double SHA256) and append first 4 bytes as checksum
-        checksum = double_sha256(payload)[:4]
-
-        # Concatenate payload and checksum
-        final_payload = payload + checksum
+        checksum = _sha256(_sha256(payload).digest()).digest()[:4]
 
         # Base58Check encode the payload
-        wif = telestai.base58.encode(final_payload)
-        return wif
+        return telestai.base58.encode(payload + checksum)
+
+    @classmethod
+    def to_wif_many(cls, secrets, compressed=True):
+        """Convert many 32-byte secrets to WIF strings
+
+        Same as cls.from_secret_bytes(secret, compressed).to_wif() for each
+        secret, but without building the keys (and so deriving their pubkeys),
+        and with the checksum hash pre-seeded with the version byte.
+        """
+        version = bytes((_SECRET_KEY,))
+        tag = _COMPRESSED_TAG if compressed else b''
+        seeded = _sha256(version)
+        encode = telestai.base58.encode
+
+        wifs = []
+        for secret in secrets:
+            if len(secret) != 32:
+                raise ValueError('secret must be 32 bytes; got %d' % len(secret))
+            payload = bytes(secret) + tag
+            h = seeded.copy()
+            h.update(payload)
+            wifs.append(encode(version + payload + _sha256(h.digest()).digest()[:4]))
+        return wifs
 
 __all__ = (
     'CTelestaiAddressError',